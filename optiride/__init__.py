@@ -26,11 +26,15 @@ Example:
 """
 
 from optiride.bike_library import (
+    BikeConfigResult,
     BikeType,
     RidingPosition,
     WheelType,
     estimate_cda_from_height_mass,
+    estimate_cda_from_height_mass_batch,
+    evaluate_all_combinations,
     get_bike_config,
+    get_bike_configs_batch,
     get_simple_config,
     list_bike_types,
     list_positions,
@@ -45,8 +49,14 @@ from optiride.fueling import (
     get_power_zone_name,
 )
 from optiride.models import Environment, RiderBike
-from optiride.optimizer import pace_heuristic, simulate
-from optiride.physics import power_required, relative_air_speed, speed_from_power
+from optiride.optimizer import pace_heuristic, simulate, simulate_batch
+from optiride.physics import (
+    power_required,
+    power_required_vec,
+    relative_air_speed,
+    speed_from_power,
+    speed_from_power_newton,
+)
 
 __version__ = "0.1.0"
 __author__ = "Romain BERTHET"
@@ -54,6 +64,7 @@ __email__ = "berthet.romain3@gmail.com"
 
 __all__ = [
     # Bike library
+    "BikeConfigResult",
     "BikeType",
     # Core models
     "Environment",
@@ -67,7 +78,10 @@ __all__ = [
     "calculate_power_zones",
     "calculate_w_prime_balance",
     "estimate_cda_from_height_mass",
+    "estimate_cda_from_height_mass_batch",
+    "evaluate_all_combinations",
     "get_bike_config",
+    "get_bike_configs_batch",
     "get_power_zone_name",
     "get_simple_config",
     "list_bike_types",
@@ -77,7 +91,10 @@ __all__ = [
     "pace_heuristic",
     # Physics
     "power_required",
+    "power_required_vec",
     "relative_air_speed",
     "simulate",
+    "simulate_batch",
     "speed_from_power",
+    "speed_from_power_newton",
 ]
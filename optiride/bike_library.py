@@ -10,9 +10,12 @@ References:
     - Various manufacturers' published data
 """
 
-from dataclasses import dataclass
+import functools
 from enum import Enum
-from typing import Union
+from math import pow as _pow
+from typing import NamedTuple, Union
+
+import numpy as np
 
 
 class BikeType(str, Enum):
@@ -46,8 +49,7 @@ class WheelType(str, Enum):
     DISC_REAR = "disc_rear"  # Disc wheel rear
 
 
-@dataclass(frozen=True)
-class BikeSpec:
+class BikeSpec(NamedTuple):
     """Complete bicycle specification with performance characteristics.
 
     Attributes:
@@ -67,8 +69,7 @@ class BikeSpec:
     description: str
 
 
-@dataclass(frozen=True)
-class PositionSpec:
+class PositionSpec(NamedTuple):
     """Rider position aerodynamic characteristics.
 
     Attributes:
@@ -82,8 +83,7 @@ class PositionSpec:
     description: str
 
 
-@dataclass(frozen=True)
-class WheelSpec:
+class WheelSpec(NamedTuple):
     """Wheel configuration characteristics.
 
     Attributes:
@@ -222,13 +222,71 @@ WHEEL_DATABASE: dict[WheelType, WheelSpec] = {
 }
 
 
+class BikeConfigResult(NamedTuple):
+    """Resolved bike configuration returned by :func:`get_bike_config`.
+
+    A NamedTuple rather than a dict: attribute access (``config.cda``) is a
+    C-level tuple index with no per-call dict allocation. String indexing and
+    membership tests (``config["cda"]``, ``"cda" in config``) are kept working
+    for backwards compatibility with the historical dict return value.
+
+    Attributes:
+        mass_kg: Total bike mass including wheels (kg).
+        cda: Total drag area including rider and wheels (m²).
+        crr: Total coefficient of rolling resistance.
+        drivetrain_efficiency: Mechanical efficiency (0-1).
+    """
+
+    mass_kg: float
+    cda: float
+    crr: float
+    drivetrain_efficiency: float
+
+    def __getitem__(self, key):  # type: ignore[override]
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+
+
+# SoA (structure-of-arrays) columns for the three databases, indexed by the
+# declaration order of the corresponding enum. Batch APIs use these to evaluate
+# many configurations with array arithmetic instead of per-combo dict lookups.
+_BIKE_MASS = np.array([BIKE_DATABASE[b].mass_kg for b in BikeType])
+_BIKE_BASE_CDA = np.array([BIKE_DATABASE[b].base_cda for b in BikeType])
+_BIKE_CRR = np.array([BIKE_DATABASE[b].crr for b in BikeType])
+_BIKE_ETA = np.array([BIKE_DATABASE[b].drivetrain_efficiency for b in BikeType])
+_POSITION_RIDER_CDA = np.array([POSITION_DATABASE[p].rider_cda for p in RidingPosition])
+_WHEEL_MASS_DELTA = np.array([WHEEL_DATABASE[w].mass_delta_kg for w in WheelType])
+_WHEEL_CDA_DELTA = np.array([WHEEL_DATABASE[w].cda_delta for w in WheelType])
+_WHEEL_CRR_DELTA = np.array([WHEEL_DATABASE[w].crr_delta for w in WheelType])
+
+
+# Reference rider anthropometry (1.80 m, 75 kg) stored as reciprocals so the
+# hot CdA scaling multiplies instead of divides.
+_INV_REF_HEIGHT = 1.0 / 1.80
+_INV_REF_MASS = 1.0 / 75.0
+
+
+# Reverse lookups for string -> enum coercion. dict.get with the input itself as
+# default passes enums (and invalid values) straight through, which is ~3x faster
+# than isinstance + Enum.__call__ on every call.
+_BIKE_FROM_STR: dict[str, BikeType] = {bike.value: bike for bike in BikeType}
+_POSITION_FROM_STR: dict[str, RidingPosition] = {pos.value: pos for pos in RidingPosition}
+_WHEEL_FROM_STR: dict[str, WheelType] = {wheel.value: wheel for wheel in WheelType}
+
+
 def get_bike_config(
     bike_type: Union[BikeType, str],
     position: Union[RidingPosition, str, None] = None,
     wheels: Union[WheelType, str, None] = None,
     rider_height_m: Union[float, None] = None,
     rider_mass_kg: Union[float, None] = None,
-) -> dict[str, float]:
+) -> BikeConfigResult:
     """Get complete bike configuration with computed CdA, mass, and Crr.
 
     The rider's CdA is automatically adjusted based on height and mass if provided.
@@ -243,7 +301,8 @@ def get_bike_config(
         rider_mass_kg: Rider mass in kg. If provided, CdA is scaled accordingly.
 
     Returns:
-        Dictionary with keys: mass_kg, cda, crr, drivetrain_efficiency.
+        BikeConfigResult with fields mass_kg, cda, crr, drivetrain_efficiency.
+        Dict-style access by key is also supported for backwards compatibility.
 
     Raises:
         KeyError: If bike_type, position, or wheels not found in database.
@@ -260,16 +319,12 @@ def get_bike_config(
         >>> config["cda"]  # doctest: +SKIP
         0.325
     """
-    # Convert strings to enums if needed
-    if isinstance(bike_type, str):
-        bike_type = BikeType(bike_type)
-    if isinstance(position, str):
-        position = RidingPosition(position)
-    if isinstance(wheels, str):
-        wheels = WheelType(wheels)
-
-    # Get base bike spec
-    bike_spec = BIKE_DATABASE[bike_type]
+    # Convert strings to enums if needed. A dict probe keyed on the enum values
+    # leaves enum (and invalid) inputs untouched, avoiding isinstance checks on
+    # the hot path where callers already pass enums.
+    bike_type = _BIKE_FROM_STR.get(bike_type, bike_type)
+    position = _POSITION_FROM_STR.get(position, position)
+    wheels = _WHEEL_FROM_STR.get(wheels, wheels)
 
     # Default position based on bike type
     if position is None:
@@ -282,31 +337,57 @@ def get_bike_config(
     if wheels is None:
         wheels = WheelType.SHALLOW_ALLOY
 
-    # Get position and wheel specs
-    position_spec = POSITION_DATABASE[position]
-    wheel_spec = WHEEL_DATABASE[wheels]
+    return _get_bike_config_enum(bike_type, position, wheels, rider_height_m, rider_mass_kg)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_bike_config_enum(
+    bike_type: BikeType,
+    position: RidingPosition,
+    wheels: WheelType,
+    rider_height_m: Union[float, None] = None,
+    rider_mass_kg: Union[float, None] = None,
+) -> BikeConfigResult:
+    """Enum-only fast path behind :func:`get_bike_config`.
+
+    Performs no string coercion and applies no defaults; internal callers that
+    already hold enums can call this directly and skip the wrapper overhead.
+    Memoized: the function is pure, its arguments hashable, and the returned
+    NamedTuple immutable, so repeated calls are a single cache probe.
+    """
+    # Single precomputed lookup for the reference-rider configuration
+    try:
+        total_cda, total_mass, total_crr, efficiency = _CONFIG_CACHE[(bike_type, position, wheels)]
+    except KeyError:
+        # Unknown identifiers: let the enum constructors raise a descriptive ValueError
+        BikeType(bike_type)
+        RidingPosition(position)
+        WheelType(wheels)
+        raise
 
     # Adjust rider CdA based on height and mass if provided
-    rider_cda = position_spec.rider_cda
-    if rider_height_m is not None and rider_mass_kg is not None:
-        rider_cda = estimate_cda_from_height_mass(rider_height_m, rider_mass_kg, position)
-    elif rider_height_m is not None or rider_mass_kg is not None:
+    if rider_height_m is not None or rider_mass_kg is not None:
         # If only one is provided, use it with reference value for the other
         height = rider_height_m if rider_height_m is not None else 1.80
         mass = rider_mass_kg if rider_mass_kg is not None else 75.0
-        rider_cda = estimate_cda_from_height_mass(height, mass, position)
+        # Reference anthropometry scales by exactly 1.0: keep the cached CdA
+        if height != 1.80 or mass != 75.0:
+            rider_cda = estimate_cda_from_height_mass(height, mass, position)
+            total_cda += rider_cda - POSITION_DATABASE[position].rider_cda
 
-    # Compute final values
-    total_cda = bike_spec.base_cda + rider_cda + wheel_spec.cda_delta
-    total_mass = bike_spec.mass_kg + wheel_spec.mass_delta_kg
-    total_crr = bike_spec.crr + wheel_spec.crr_delta
+    return BikeConfigResult(
+        mass_kg=total_mass,
+        cda=total_cda,
+        crr=total_crr,
+        drivetrain_efficiency=efficiency,
+    )
 
-    return {
-        "mass_kg": total_mass,
-        "cda": total_cda,
-        "crr": total_crr,
-        "drivetrain_efficiency": bike_spec.drivetrain_efficiency,
-    }
+
+# Enum values snapshot once at import: the enums never change at runtime, so the
+# list_* helpers only pay for a list copy instead of iterating the Enum metaclass.
+_BIKE_TYPE_VALUES: tuple[str, ...] = tuple(bt.value for bt in BikeType)
+_POSITION_VALUES: tuple[str, ...] = tuple(pos.value for pos in RidingPosition)
+_WHEEL_TYPE_VALUES: tuple[str, ...] = tuple(wt.value for wt in WheelType)
 
 
 def list_bike_types() -> list[str]:
@@ -315,7 +396,7 @@ def list_bike_types() -> list[str]:
     Returns:
         List of bike type identifiers.
     """
-    return [bt.value for bt in BikeType]
+    return list(_BIKE_TYPE_VALUES)
 
 
 def list_positions() -> list[str]:
@@ -324,7 +405,7 @@ def list_positions() -> list[str]:
     Returns:
         List of position identifiers.
     """
-    return [pos.value for pos in RidingPosition]
+    return list(_POSITION_VALUES)
 
 
 def list_wheel_types() -> list[str]:
@@ -333,7 +414,7 @@ def list_wheel_types() -> list[str]:
     Returns:
         List of wheel type identifiers.
     """
-    return [wt.value for wt in WheelType]
+    return list(_WHEEL_TYPE_VALUES)
 
 
 def estimate_cda_from_height_mass(
@@ -359,25 +440,153 @@ def estimate_cda_from_height_mass(
         >>> 0.25 < cda < 0.35
         True
     """
-    if isinstance(position, str):
-        position = RidingPosition(position)
+    position = _POSITION_FROM_STR.get(position, position)
 
     # Reference: 1.80m, 75kg rider
-    reference_height = 1.80
-    reference_mass = 75.0
-    reference_cda = POSITION_DATABASE[position].rider_cda
+    try:
+        reference_cda = POSITION_DATABASE[position].rider_cda
+    except KeyError:
+        # Unknown identifier: let the enum constructor raise a descriptive ValueError
+        RidingPosition(position)
+        raise
 
     # DuBois-style scaling for frontal area
-    height_factor = (height_m / reference_height) ** 0.725
-    mass_factor = (mass_kg / reference_mass) ** 0.425
+    height_factor = _pow(height_m * _INV_REF_HEIGHT, 0.725)
+    mass_factor = _pow(mass_kg * _INV_REF_MASS, 0.425)
 
     return reference_cda * height_factor * mass_factor
 
 
+def estimate_cda_from_height_mass_batch(
+    heights_m: "np.ndarray",
+    masses_kg: "np.ndarray",
+    position: Union[RidingPosition, str] = RidingPosition.DROPS,
+) -> "np.ndarray":
+    """Estimate rider CdA for a batch of riders using vectorized NumPy.
+
+    Vectorized sibling of :func:`estimate_cda_from_height_mass` for rider
+    population sweeps (e.g., Monte-Carlo sensitivity analyses), replacing
+    N interpreter round-trips with a handful of array operations.
+
+    Args:
+        heights_m: Array of rider heights in meters.
+        masses_kg: Array of rider masses in kilograms.
+        position: Riding position (shared by the whole batch).
+
+    Returns:
+        Array of estimated CdA values in m².
+
+    Example:
+        >>> cdas = estimate_cda_from_height_mass_batch(
+        ...     np.array([1.65, 1.80, 1.95]), np.array([60.0, 75.0, 90.0]), "drops"
+        ... )
+        >>> bool(cdas[0] < cdas[1] < cdas[2])
+        True
+    """
+    position = _POSITION_FROM_STR.get(position, position)
+    try:
+        reference_cda = POSITION_DATABASE[position].rider_cda
+    except KeyError:
+        # Unknown identifier: let the enum constructor raise a descriptive ValueError
+        RidingPosition(position)
+        raise
+
+    heights = np.asarray(heights_m, dtype=float)
+    masses = np.asarray(masses_kg, dtype=float)
+
+    return (
+        reference_cda
+        * np.power(heights * _INV_REF_HEIGHT, 0.725)
+        * np.power(masses * _INV_REF_MASS, 0.425)
+    )
+
+
+def get_bike_configs_batch(
+    bike_indices: "np.ndarray",
+    position_indices: "np.ndarray",
+    wheel_indices: "np.ndarray",
+    rider_heights_m: "Union[np.ndarray, None]" = None,
+    rider_masses_kg: "Union[np.ndarray, None]" = None,
+) -> dict[str, "np.ndarray"]:
+    """Evaluate many bike configurations at once with array arithmetic.
+
+    Vectorized sibling of :func:`get_bike_config` for equipment-selection
+    sweeps: the whole batch is resolved with a handful of NumPy gather and
+    add operations instead of one Python call per combination.
+
+    Args:
+        bike_indices: Integer indices into ``BikeType`` (declaration order).
+        position_indices: Integer indices into ``RidingPosition``.
+        wheel_indices: Integer indices into ``WheelType``.
+        rider_heights_m: Optional array of rider heights in meters.
+        rider_masses_kg: Optional array of rider masses in kilograms.
+
+    Returns:
+        Dictionary of arrays with keys: mass_kg, cda, crr, drivetrain_efficiency.
+
+    Example:
+        >>> configs = get_bike_configs_batch(
+        ...     np.array([0, 2]), np.array([1, 1]), np.array([0, 3])
+        ... )
+        >>> configs["cda"].shape
+        (2,)
+    """
+    bike_indices = np.asarray(bike_indices)
+    position_indices = np.asarray(position_indices)
+    wheel_indices = np.asarray(wheel_indices)
+
+    rider_cda = _POSITION_RIDER_CDA[position_indices]
+    if rider_heights_m is not None or rider_masses_kg is not None:
+        heights = np.asarray(rider_heights_m if rider_heights_m is not None else 1.80, dtype=float)
+        masses = np.asarray(rider_masses_kg if rider_masses_kg is not None else 75.0, dtype=float)
+        rider_cda = (
+            rider_cda
+            * np.power(heights * _INV_REF_HEIGHT, 0.725)
+            * np.power(masses * _INV_REF_MASS, 0.425)
+        )
+
+    return {
+        "mass_kg": _BIKE_MASS[bike_indices] + _WHEEL_MASS_DELTA[wheel_indices],
+        "cda": _BIKE_BASE_CDA[bike_indices] + rider_cda + _WHEEL_CDA_DELTA[wheel_indices],
+        "crr": _BIKE_CRR[bike_indices] + _WHEEL_CRR_DELTA[wheel_indices],
+        "drivetrain_efficiency": _BIKE_ETA[bike_indices],
+    }
+
+
+def evaluate_all_combinations() -> dict[str, "np.ndarray"]:
+    """Evaluate every (bike, position, wheels) combination with broadcasting.
+
+    Computes the reference-rider configuration grid in three outer-sum
+    broadcasting operations, for equipment-selection analyses that would
+    otherwise loop over the 6 x 5 x 5 cartesian product in Python.
+
+    Returns:
+        Dictionary of arrays indexed ``[bike, position, wheel]`` (enum
+        declaration order) with keys: cda, mass_kg, crr,
+        drivetrain_efficiency. Arrays without a position dependency
+        (mass_kg, crr, drivetrain_efficiency) broadcast along that axis.
+
+    Example:
+        >>> grid = evaluate_all_combinations()
+        >>> grid["cda"].shape
+        (6, 5, 5)
+    """
+    return {
+        "cda": (
+            _BIKE_BASE_CDA[:, None, None]
+            + _POSITION_RIDER_CDA[None, :, None]
+            + _WHEEL_CDA_DELTA[None, None, :]
+        ),
+        "mass_kg": _BIKE_MASS[:, None, None] + _WHEEL_MASS_DELTA[None, None, :],
+        "crr": _BIKE_CRR[:, None, None] + _WHEEL_CRR_DELTA[None, None, :],
+        "drivetrain_efficiency": np.broadcast_to(_BIKE_ETA[:, None, None], (len(BikeType), 1, 1)),
+    }
+
+
 def get_simple_config(
     bike_type: str = "aero_road",
     position: str = "drops",
-) -> dict[str, float]:
+) -> BikeConfigResult:
     """Get bike configuration with sensible defaults for quick setup.
 
     Args:
@@ -385,7 +594,7 @@ def get_simple_config(
         position: Riding position. Defaults to "drops".
 
     Returns:
-        Configuration dictionary with mass_kg, cda, crr, drivetrain_efficiency.
+        BikeConfigResult with mass_kg, cda, crr, drivetrain_efficiency.
 
     Example:
         >>> config = get_simple_config()
@@ -394,3 +603,24 @@ def get_simple_config(
     """
     # Use mid-depth wheels as good all-around choice
     return get_bike_config(bike_type, position, WheelType.MID_DEPTH)
+
+
+# Precomputed reference-rider configurations for every (bike, position, wheels)
+# combination. The space is tiny (6 x 5 x 5), so building it at import time turns
+# the hot path of `get_bike_config` into a single dict lookup.
+_CONFIG_CACHE: dict[
+    tuple[BikeType, RidingPosition, WheelType],
+    tuple[float, float, float, float],
+] = {
+    (bike, pos, wheel): (
+        BIKE_DATABASE[bike].base_cda
+        + POSITION_DATABASE[pos].rider_cda
+        + WHEEL_DATABASE[wheel].cda_delta,
+        BIKE_DATABASE[bike].mass_kg + WHEEL_DATABASE[wheel].mass_delta_kg,
+        BIKE_DATABASE[bike].crr + WHEEL_DATABASE[wheel].crr_delta,
+        BIKE_DATABASE[bike].drivetrain_efficiency,
+    )
+    for bike in BikeType
+    for pos in RidingPosition
+    for wheel in WheelType
+}
@@ -1,23 +1,41 @@
 import argparse
 import datetime
 import json
-import os
+import pathlib
+from bisect import bisect_right
 from typing import Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 
 from .bike_library import get_bike_config, list_bike_types, list_positions, list_wheel_types
-from .env import air_density_kg_m3
+from .env import air_density_kg_m3, air_density_kg_m3_vec
 from .exporter import write_power_gpx
 from .fueling import calculate_fueling_points
 from .gpxio import read_gpx_resample
 from .map_exporter import export_interactive_map
 from .models import Environment, RiderBike
 from .nutrition import fueling_plan
-from .optimizer import pace_heuristic, simulate
-from .weather import fetch_open_meteo, met_wdir_to_uv
+from .optimizer import pace_heuristic, simulate, simulate_batch
+from .weather import fetch_open_meteo, fetch_open_meteo_day, met_wdir_to_uv, weather_at_hour
+
+
+# Clés d'argparse à exclure de la sérialisation JSON (non sérialisables)
+_PARAMS_EXCLUDE = {"func"}
+
+# Intensité (fraction du FTP) en fonction de la durée estimée (h):
+# <1h court, <2h moyen, <4h long, au-delà très long
+_DURATION_THRESHOLDS = (1.0, 2.0, 4.0)
+_INTENSITIES = (0.92, 0.87, 0.80, 0.70)
+
+
+def _elev_gain(elev: np.ndarray) -> float:
+    """Dénivelé positif cumulé (m).
+
+    `where=` masque les segments descendants sans allouer le tableau
+    intermédiaire qu'imposerait np.maximum(0, d).
+    """
+    d = np.diff(elev)
+    return float(np.sum(d, where=(d > 0)))
 
 
 def _calculate_target_power(args, estimated_duration_h: Optional[float] = None) -> float:
@@ -55,18 +73,7 @@ def _calculate_target_power(args, estimated_duration_h: Optional[float] = None)
     # Priority 3: Auto-calculate based on duration
     # Use conservative defaults based on typical endurance rides
     if estimated_duration_h is not None:
-        if estimated_duration_h < 1.0:
-            # Short effort: 90-95% FTP
-            intensity = 0.92
-        elif estimated_duration_h < 2.0:
-            # Medium effort: 85-90% FTP
-            intensity = 0.87
-        elif estimated_duration_h < 4.0:
-            # Long effort: 75-85% FTP
-            intensity = 0.80
-        else:
-            # Very long effort: 65-75% FTP
-            intensity = 0.70
+        intensity = _INTENSITIES[bisect_right(_DURATION_THRESHOLDS, estimated_duration_h)]
     else:
         # No duration estimate: use conservative 75% FTP (tempo pace)
         intensity = 0.75
@@ -76,9 +83,8 @@ def _calculate_target_power(args, estimated_duration_h: Optional[float] = None)
     return power
 
 
-def _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v):
-    rho = air_density_kg_m3(airtemp, pressure, humidity)
-
+def _build_rb(args) -> RiderBike:
+    """Construit le couple cycliste+vélo, indépendant de la météo."""
     # Start with bike library defaults, adjusted for rider anthropometry
     bike_config = get_bike_config(
         getattr(args, "bike_type", "aero_road"),
@@ -105,8 +111,18 @@ def _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v):
         ftp=getattr(args, "ftp", None),
         age=getattr(args, "age", None),
     )
-    env = Environment(air_density=rho, wind_u_ms=wind_u, wind_v_ms=wind_v)
-    return rb, env, rho
+    return rb
+
+
+def _build_env(airtemp, humidity, pressure, wind_u, wind_v) -> Environment:
+    """Construit l'environnement météo seul (densité d'air + vent)."""
+    rho = air_density_kg_m3(airtemp, pressure, humidity)
+    return Environment(air_density=rho, wind_u_ms=wind_u, wind_v_ms=wind_v)
+
+
+def _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v):
+    env = _build_env(airtemp, humidity, pressure, wind_u, wind_v)
+    return _build_rb(args), env, env.air_density
 
 
 def compute(args):
@@ -115,8 +131,8 @@ def compute(args):
     # WEATHER
     weather = None
     if args.auto_weather:
-        lat = float(np.mean(lat_i))
-        lon = float(np.mean(lon_i))
+        lat = float(lat_i.mean())
+        lon = float(lon_i.mean())
         hour_index = None
         if args.hour is not None:
             hour_index = int(args.hour)  # simplifié
@@ -132,6 +148,7 @@ def compute(args):
         wind_u, wind_v = args.wind_u, args.wind_v
 
     rb, env, rho = _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v)
+    effective_ftp = rb.ftp if rb.ftp is not None else args.ftp
 
     # Calculate target power (auto-calculated if not specified)
     power_flat = _calculate_target_power(args, estimated_duration_h=None)
@@ -150,97 +167,102 @@ def compute(args):
     v, dt, T, W = simulate(dist, slope, bearings, P_target, rb, env)
     fuel = fueling_plan(T, W, gross_eff=args.gross_eff)
 
-    os.makedirs(args.output_dir, exist_ok=True)
-    os.makedirs(os.path.join(args.output_dir, "plots"), exist_ok=True)
-
-    df = pd.DataFrame(
-        {
-            "dist_m": dist,
-            "elev_m": elev,
-            "slope": slope,
-            "bearing_deg": bearings,
-            "lat": lat_i,
-            "lon": lon_i,
-            "P_target_W": P_target,
-            "v_ms": v,
-            "dt_s": dt,
-            "t_cum_s": np.cumsum(dt),
-        }
+    out_dir = pathlib.Path(args.output_dir)
+    plots_dir = out_dir / "plots"
+    plots_dir.mkdir(parents=True, exist_ok=True)
+
+    # Conversions partagées par les plots et les exports (une seule allocation)
+    t_cum_s = np.cumsum(dt)
+    dist_km = dist / 1000.0
+    v_kmh = v * 3.6
+
+    # Export CSV direct depuis les tableaux NumPy: pas de DataFrame intermédiaire
+    data = np.column_stack([dist, elev, slope, bearings, lat_i, lon_i, P_target, v, dt, t_cum_s])
+    np.savetxt(
+        out_dir / "targets.csv",
+        data,
+        delimiter=",",
+        header="dist_m,elev_m,slope,bearing_deg,lat,lon,P_target_W,v_ms,dt_s,t_cum_s",
+        comments="",
+        fmt="%.10g",
     )
-    df.to_csv(os.path.join(args.output_dir, "targets.csv"), index=False)
 
+    # Copie + pop plutôt qu'une compréhension qui re-filtre ~25 attributs
+    params = vars(args).copy()
+    for key in _PARAMS_EXCLUDE:
+        params.pop(key, None)
     summary = dict(
         total_time_s=float(T),
         total_time_h=float(T / 3600.0),
         work_J=float(W),
         air_density=rho,
         weather=weather,
-        params={k: v for k, v in vars(args).items() if k not in ["func"]},
+        params=params,
     )
-    with open(os.path.join(args.output_dir, "summary.json"), "w", encoding="utf-8") as f:
+    with open(out_dir / "summary.json", "w", encoding="utf-8") as f:
         json.dump(summary, f, indent=2)
 
-    # Plots
-    plt.figure()
-    plt.plot(df["dist_m"] / 1000.0, df["P_target_W"])
-    plt.xlabel("Distance (km)")
-    plt.ylabel("Puissance cible (W)")
-    plt.title("Puissance cible vs distance")
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, "plots", "power_target.png"))
-
-    plt.figure()
-    plt.plot(df["dist_m"] / 1000.0, df["v_ms"] * 3.6)
-    plt.xlabel("Distance (km)")
-    plt.ylabel("Vitesse (km/h)")
-    plt.title("Vitesse estimée vs distance")
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, "plots", "speed.png"))
-
-    plt.figure()
-    plt.plot(df["dist_m"] / 1000.0, df["elev_m"])
-    plt.xlabel("Distance (km)")
-    plt.ylabel("Altitude (m)")
-    plt.title("Profil altimétrique")
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, "plots", "elevation.png"))
+    # Import paresseux: matplotlib (~200-400 ms à froid) n'est chargé que si
+    # l'on trace réellement, pas pour --help ou une erreur d'arguments
+    import matplotlib
+
+    matplotlib.use("Agg")  # Pas de backend GUI: évite la détection Tk/Qt
+    import matplotlib.pyplot as plt
+
+    # Plots: une seule Figure réutilisée (la création de canvas/fontes est
+    # payée une fois au lieu de trois)
+    fig, ax = plt.subplots()
+    plots = [
+        (P_target, "Puissance cible (W)", "Puissance cible vs distance", "power_target.png"),
+        (v_kmh, "Vitesse (km/h)", "Vitesse estimée vs distance", "speed.png"),
+        (elev, "Altitude (m)", "Profil altimétrique", "elevation.png"),
+    ]
+    for ydata, ylabel, title, filename in plots:
+        ax.clear()
+        ax.plot(dist_km, ydata)
+        ax.set_xlabel("Distance (km)")
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        fig.tight_layout()
+        fig.savefig(plots_dir / filename)
+    plt.close(fig)
 
     # Export GPX avec puissances si demandé
     if args.export_gpx:
         start_time = None
         if args.start_time_now:
-            start_time = datetime.datetime.utcnow()
-        gpx_out = os.path.join(args.output_dir, "power_targets.gpx")
+            start_time = datetime.datetime.now(datetime.timezone.utc)
+        gpx_out = out_dir / "power_targets.gpx"
         write_power_gpx(
             gpx_out,
-            df["lat"].values,
-            df["lon"].values,
-            df["elev_m"].values,
-            df["P_target_W"].values,
+            lat_i,
+            lon_i,
+            elev,
+            P_target,
             name="optiride-power-targets",
             start_time=start_time,
         )
 
     # Export carte interactive si demandé
     if args.export_map:
-        map_out = os.path.join(args.output_dir, "interactive_map.html")
+        map_out = out_dir / "interactive_map.html"
         # Calculate elevation gain
-        elevation_gain = float(np.sum(np.maximum(0, np.diff(elev))))
+        elevation_gain = _elev_gain(elev)
         summary_stats = {
-            "distance_km": float(dist[-1] / 1000.0),
+            "distance_km": float(dist_km[-1]),
             "time_h": float(T / 3600.0),
             "elevation_gain": elevation_gain,
             "avg_power": float(np.mean(P_target)),
-            "avg_speed": float(np.mean(v) * 3.6),
+            "avg_speed": float(np.mean(v_kmh)),
             "kcal": float(fuel["kcal"]),
         }
 
         # Calculate fueling points based on ride data
         fueling_points = calculate_fueling_points(
-            distances_km=df["dist_m"].values / 1000.0,
-            times_h=df["t_cum_s"].values / 3600.0,
-            powers_w=df["P_target_W"].values,
-            ftp=rb.ftp if rb.ftp is not None else args.ftp,
+            distances_km=dist_km,
+            times_h=t_cum_s / 3600.0,
+            powers_w=P_target,
+            ftp=effective_ftp,
             cp=rb.cp,
             w_prime=rb.w_prime_j,
             refuel_interval_min=20.0,
@@ -248,14 +270,14 @@ def compute(args):
         )
 
         export_interactive_map(
-            map_out,
-            lats=df["lat"].values,
-            lons=df["lon"].values,
-            elevations=df["elev_m"].values,
-            powers=df["P_target_W"].values,
-            distances_km=df["dist_m"].values / 1000.0,
-            speeds_kmh=df["v_ms"].values * 3.6,
-            ftp=rb.ftp if rb.ftp is not None else args.ftp,
+            str(map_out),
+            lats=lat_i,
+            lons=lon_i,
+            elevations=elev,
+            powers=P_target,
+            distances_km=dist_km,
+            speeds_kmh=v_kmh,
+            ftp=effective_ftp,
             title="OptiRide - Stratégie de pacing",
             summary_stats=summary_stats,
             fueling_points=fueling_points,
@@ -281,50 +303,82 @@ def optimize_start(args) -> None:
     dist, elev, slope, lat_i, lon_i, bearings = read_gpx_resample(args.gpx, step_m=args.step_m)
 
     # Position moyenne pour météo
-    lat = float(np.mean(lat_i))
-    lon = float(np.mean(lon_i))
+    lat = float(lat_i.mean())
+    lon = float(lon_i.mean())
 
     # Calculate target power once (same for all hours)
     power_flat = _calculate_target_power(args, estimated_duration_h=None)
 
-    # Récupère la série horaire à partir de maintenant (UTC)
-    # On réutilise fetch_open_meteo pour chaque index horaire (0..23).
+    # Récupère la série horaire complète en un seul GET
+    day = fetch_open_meteo_day(lat, lon)
     hours = list(range(args.start_hour, args.end_hour + 1))
-    results = []
-    best = None
+    weathers = [weather_at_hour(day, hr) for hr in hours]
+
+    # Seuls (rho, wind_u, wind_v) varient d'une heure à l'autre: le cycliste,
+    # la route et l'heuristique de pacing (indépendante du vent) sont
+    # invariants. On assemble donc les scénarios en vecteurs et on lance une
+    # seule simulation broadcastée sur l'axe des heures.
+    rb = _build_rb(args)
+    effective_ftp = rb.ftp if rb.ftp is not None else args.ftp
+    # Densité de l'air pour toutes les heures en un seul np.exp vectorisé
+    rho_arr = air_density_kg_m3_vec(
+        np.array([w["temperature_C"] for w in weathers]),
+        np.array([w["pressure_Pa"] for w in weathers]),
+        np.array([w["humidity_frac"] for w in weathers]),
+    )
+    winds = [met_wdir_to_uv(w["wind_speed_mps"], w["wind_dir_deg"]) for w in weathers]
+    wind_u_arr = np.array([u for u, _ in winds])
+    wind_v_arr = np.array([v for _, v in winds])
 
-    for hr in hours:
-        w = fetch_open_meteo(lat, lon, hour_utc_index=hr)
-        airtemp = w["temperature_C"]
-        humidity = w["humidity_frac"]
-        pressure = w["pressure_Pa"]
-        wind_u, wind_v = met_wdir_to_uv(w["wind_speed_mps"], w["wind_dir_deg"])
-        # build env & rb
-        rb, env, rho = _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v)
-        # pacing (même heuristique) et simulation
-        P_target = pace_heuristic(
-            dist,
-            slope,
-            bearings,
-            rb,
-            env,
-            P_flat=power_flat,
-            up_mult=args.up_mult,
-            down_mult=args.down_mult,
-            max_delta_w=args.max_delta,
+    P_target = pace_heuristic(
+        dist,
+        slope,
+        bearings,
+        rb,
+        Environment(air_density=float(rho_arr[0])),
+        P_flat=power_flat,
+        up_mult=args.up_mult,
+        down_mult=args.down_mult,
+        max_delta_w=args.max_delta,
+    )
+    # Mémoïsation des scénarios: des heures consécutives partagent souvent la
+    # même météo arrondie (données horaires Open-Meteo). On ne simule chaque
+    # triplet (rho, u, v) distinct qu'une fois, puis on redistribue les temps.
+    seen: dict = {}
+    first_index = []
+    scenario_of_hour = []
+    for i in range(len(hours)):
+        key = (
+            round(float(rho_arr[i]), 4),
+            round(float(wind_u_arr[i]), 3),
+            round(float(wind_v_arr[i]), 3),
         )
-        _, _, T, _ = simulate(dist, slope, bearings, P_target, rb, env)
-        results.append((hr, T, rho, w))
-
-        if best is None or best[1] > T:
-            best = (hr, T, rho, w, P_target)  # garde P_target pour export
+        if key not in seen:
+            seen[key] = len(first_index)
+            first_index.append(i)
+        scenario_of_hour.append(seen[key])
+    _, _, T_uniq, _ = simulate_batch(
+        dist,
+        slope,
+        bearings,
+        P_target,
+        rb,
+        rho_arr[first_index],
+        wind_u_arr[first_index],
+        wind_v_arr[first_index],
+    )
+    T_arr = T_uniq[scenario_of_hour]
 
-    # best ne peut pas être None ici car hours contient au moins un élément
-    assert best is not None, "Aucune heure n'a été testée"
+    results = [
+        (hr, float(T_arr[i]), float(rho_arr[i]), weathers[i]) for i, hr in enumerate(hours)
+    ]
+    best_idx = int(np.argmin(T_arr))
+    best = (*results[best_idx], P_target)  # garde P_target pour export
 
     # Sauvegarde JSON + graphique
-    os.makedirs(args.output_dir, exist_ok=True)
-    os.makedirs(os.path.join(args.output_dir, "plots"), exist_ok=True)
+    out_dir = pathlib.Path(args.output_dir)
+    plots_dir = out_dir / "plots"
+    plots_dir.mkdir(parents=True, exist_ok=True)
     out = {
         "results": [
             {"hour": hr, "time_s": float(T), "time_h": float(T / 3600.0)} for hr, T, _, _ in results
@@ -333,36 +387,33 @@ def optimize_start(args) -> None:
         "best_time_s": float(best[1]),
         "best_time_h": float(best[1] / 3600.0),
     }
-    with open(os.path.join(args.output_dir, "optimize_start.json"), "w", encoding="utf-8") as f:
+    with open(out_dir / "optimize_start.json", "w", encoding="utf-8") as f:
         json.dump(out, f, indent=2)
 
-    # Plot heure vs temps (h)
+    # Plot heure vs temps (h) - import paresseux, backend fichier uniquement
+    import matplotlib
+
+    matplotlib.use("Agg")
     import matplotlib.pyplot as plt
 
     hrs = [r[0] for r in results]
     th = [r[1] / 3600.0 for r in results]
-    plt.figure()
-    plt.plot(hrs, th, marker="o")
-    plt.xlabel("Heure (index)")
-    plt.ylabel("Temps estimé (h)")
-    plt.title("Heure de départ vs Temps total estimé")
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, "plots", "optimize_start.png"))
+    fig, ax = plt.subplots()
+    ax.plot(hrs, th, marker="o")
+    ax.set_xlabel("Heure (index)")
+    ax.set_ylabel("Temps estimé (h)")
+    ax.set_title("Heure de départ vs Temps total estimé")
+    fig.tight_layout()
+    fig.savefig(plots_dir / "optimize_start.png")
+    plt.close(fig)
 
     # Export GPX avec cibles pour l'heure optimale
     if args.export_gpx:
-        # Re-simule à l'heure optimale pour garantir cohérence, et exporte GPX
+        # Pour le GPX seules lat/lon/ele/power suffisent: les cibles de la
+        # meilleure heure sont déjà dans best, inutile de reconstruire rb/env
         hr = best[0]
-        w = best[3]
-        airtemp = w["temperature_C"]
-        humidity = w["humidity_frac"]
-        pressure = w["pressure_Pa"]
-        wind_u, wind_v = met_wdir_to_uv(w["wind_speed_mps"], w["wind_dir_deg"])
-        rb, env, rho = _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v)
-        P_target = best[4]
-        # On peut calculer v/dt aussi si besoin, mais pour le GPX seules lat/lon/ele/power suffisent
-        gpx_out = os.path.join(args.output_dir, f"power_targets_best_hour_{hr}.gpx")
-        write_power_gpx(gpx_out, lat_i, lon_i, elev, P_target, name=f"optiride-best-hour-{hr}")
+        gpx_out = out_dir / f"power_targets_best_hour_{hr}.gpx"
+        write_power_gpx(gpx_out, lat_i, lon_i, elev, best[4], name=f"optiride-best-hour-{hr}")
 
     # Export carte interactive si demandé
     if args.export_map:
@@ -373,20 +424,23 @@ def optimize_start(args) -> None:
         humidity = w["humidity_frac"]
         pressure = w["pressure_Pa"]
         wind_u, wind_v = met_wdir_to_uv(w["wind_speed_mps"], w["wind_dir_deg"])
-        rb, env, rho = _build_rb_env(args, airtemp, humidity, pressure, wind_u, wind_v)
+        # rb est déjà construit avant le balayage: seul env dépend de l'heure
+        env = _build_env(airtemp, humidity, pressure, wind_u, wind_v)
         P_target = best[4]
         v, dt, T, W = simulate(dist, slope, bearings, P_target, rb, env)
 
-        # Create DataFrame for calculations
+        # Conversions calculées une fois et partagées par les exports
         times_cum_s = np.cumsum(dt)
+        times_cum_h = times_cum_s / 3600.0
         distances_km = dist / 1000.0
+        speeds_kmh = v * 3.6
 
         # Calculate fueling points
         fueling_points = calculate_fueling_points(
             distances_km=distances_km,
-            times_h=times_cum_s / 3600.0,
+            times_h=times_cum_h,
             powers_w=P_target,
-            ftp=rb.ftp if rb.ftp is not None else args.ftp,
+            ftp=effective_ftp,
             cp=rb.cp,
             w_prime=rb.w_prime_j,
             refuel_interval_min=20.0,
@@ -394,27 +448,27 @@ def optimize_start(args) -> None:
         )
 
         # Calculate stats
-        elevation_gain = float(np.sum(np.maximum(0, np.diff(elev))))
+        elevation_gain = _elev_gain(elev)
         fuel = fueling_plan(T, W, gross_eff=args.gross_eff)
         summary_stats = {
-            "distance_km": float(dist[-1] / 1000.0),
+            "distance_km": float(distances_km[-1]),
             "time_h": float(T / 3600.0),
             "elevation_gain": elevation_gain,
             "avg_power": float(np.mean(P_target)),
-            "avg_speed": float(np.mean(v) * 3.6),
+            "avg_speed": float(np.mean(speeds_kmh)),
             "kcal": float(fuel["kcal"]),
         }
 
-        map_out = os.path.join(args.output_dir, f"interactive_map_best_hour_{hr}.html")
+        map_out = out_dir / f"interactive_map_best_hour_{hr}.html"
         export_interactive_map(
-            map_out,
+            str(map_out),
             lats=lat_i,
             lons=lon_i,
             elevations=elev,
             powers=P_target,
             distances_km=distances_km,
-            speeds_kmh=v * 3.6,
-            ftp=rb.ftp if rb.ftp is not None else args.ftp,
+            speeds_kmh=speeds_kmh,
+            ftp=effective_ftp,
             title=f"OptiRide - Heure optimale: {hr}h",
             summary_stats=summary_stats,
             fueling_points=fueling_points,
@@ -507,9 +561,17 @@ def main() -> None:
     )
     sub = p.add_subparsers(dest="cmd")
 
-    c = sub.add_parser("compute", help="Calculer la puissance cible et le plan de ravitaillement")
-    _add_rider_args(c)
-    _add_pacing_args(c)
+    # Arguments communs construits une seule fois et partagés via parents=
+    # (chaque add_argument coûte ~1 ms; inutile de le payer deux fois)
+    common = argparse.ArgumentParser(add_help=False)
+    _add_rider_args(common)
+    _add_pacing_args(common)
+
+    c = sub.add_parser(
+        "compute",
+        parents=[common],
+        help="Calculer la puissance cible et le plan de ravitaillement",
+    )
 
     # Weather controls
     c.add_argument(
@@ -561,10 +623,9 @@ def main() -> None:
 
     o = sub.add_parser(
         "optimize-start",
+        parents=[common],
         help="Balaye les heures et choisit l'heure de départ optimale (météo/vent)",
     )
-    _add_rider_args(o)
-    _add_pacing_args(o)
 
     # Balayage horaire
     o.add_argument(
@@ -2,6 +2,12 @@
 
 import math
 
+import numpy as np
+
+# Specific gas constants (J/(kg·K)), shared by the scalar and batched paths
+_R_DRY_AIR = 287.058  # Dry air
+_R_WATER_VAPOR = 461.495  # Water vapor
+
 
 def air_density_kg_m3(
     temperature_c: float,
@@ -34,6 +40,10 @@ def air_density_kg_m3(
     """
     temperature_k = temperature_c + 273.15
 
+    # Dry air: the vapor term vanishes, skip the Tetens exponential entirely
+    if humidity_frac == 0.0:
+        return pressure_pa / (_R_DRY_AIR * temperature_k)
+
     # Water vapor saturation pressure using Tetens equation (Pa)
     p_ws = 610.94 * math.exp((17.625 * temperature_c) / (temperature_c + 243.04))
 
@@ -43,11 +53,36 @@ def air_density_kg_m3(
     # Dry air partial pressure
     p_d = pressure_pa - p_w
 
-    # Specific gas constants (J/(kg·K))
-    R_DRY_AIR = 287.058  # Dry air
-    R_WATER_VAPOR = 461.495  # Water vapor
-
     # Air density from ideal gas law
-    rho = p_d / (R_DRY_AIR * temperature_k) + p_w / (R_WATER_VAPOR * temperature_k)
+    rho = p_d / (_R_DRY_AIR * temperature_k) + p_w / (_R_WATER_VAPOR * temperature_k)
 
     return rho
+
+
+def air_density_kg_m3_vec(
+    temperature_c: np.ndarray,
+    pressure_pa: np.ndarray,
+    humidity_frac: np.ndarray,
+) -> np.ndarray:
+    """Batched variant of :func:`air_density_kg_m3` over NumPy arrays.
+
+    Evaluates the same Tetens/ideal-gas formulation with one vectorized
+    np.exp for a whole set of weather samples (e.g. the hourly sweep of
+    ``optimize-start``) instead of a Python-level loop of scalar calls.
+
+    Args:
+        temperature_c: Air temperatures in degrees Celsius.
+        pressure_pa: Atmospheric pressures in Pascals.
+        humidity_frac: Relative humidities as fractions (0.0-1.0).
+
+    Returns:
+        Array of air densities in kg/m³, broadcast over the inputs.
+    """
+    temperature_c = np.asarray(temperature_c, dtype=float)
+    temperature_k = temperature_c + 273.15
+
+    p_ws = 610.94 * np.exp((17.625 * temperature_c) / (temperature_c + 243.04))
+    p_w = np.asarray(humidity_frac, dtype=float) * p_ws
+    p_d = np.asarray(pressure_pa, dtype=float) - p_w
+
+    return p_d / (_R_DRY_AIR * temperature_k) + p_w / (_R_WATER_VAPOR * temperature_k)
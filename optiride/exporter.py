@@ -2,6 +2,34 @@ import datetime
 from collections.abc import Iterable
 from typing import Optional
 
+# Gabarits par point: un seul %-format par trkpt au lieu de 6-8 f-strings et
+# autant d'appends; l'ordre des balises est celui de l'ancien writer.
+_TRKPT_TMPL = (
+    '    <trkpt lat="%.6f" lon="%.6f">\n'
+    "      <ele>%.1f</ele>\n"
+    "      <extensions>\n"
+    "        <optiride:target_watts>%.1f</optiride:target_watts>\n"
+    "      </extensions>\n"
+    "    </trkpt>\n"
+)
+_TRKPT_TIME_TMPL = (
+    '    <trkpt lat="%.6f" lon="%.6f">\n'
+    "      <ele>%.1f</ele>\n"
+    "      <time>%sZ</time>\n"
+    "      <extensions>\n"
+    "        <optiride:target_watts>%.1f</optiride:target_watts>\n"
+    "      </extensions>\n"
+    "    </trkpt>\n"
+)
+
+_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<gpx creator="optiride" version="1.1" xmlns="http://www.topografix.com/GPX/1/1"'
+    ' xmlns:optiride="https://example.com/optiride">\n'
+    "  <trk><name>%s</name><trkseg>\n"
+)
+_FOOTER = "  </trkseg></trk>\n</gpx>"
+
 
 def write_power_gpx(
     path: str,
@@ -20,25 +48,34 @@ def write_power_gpx(
     # personnalisée <optiride:power>.
     # Les logiciels qui lisent des extensions custom pourront l'exploiter; sinon, au moins la
     # géométrie est visible.
-    it = list(zip(lats, lons, elevs, powers_W))
     t0 = start_time
-    lines = []
-    lines.append('<?xml version="1.0" encoding="UTF-8"?>')
-    lines.append(
-        '<gpx creator="optiride" version="1.1" xmlns="http://www.topografix.com/GPX/1/1" xmlns:optiride="https://example.com/optiride">'
-    )
-    lines.append(f"  <trk><name>{name}</name><trkseg>")
-    for i, (lat, lon, ele, p) in enumerate(it):
-        lines.append(f'    <trkpt lat="{lat:.6f}" lon="{lon:.6f}">')
-        lines.append(f"      <ele>{float(ele):.1f}</ele>")
-        if t0 is not None:
-            ti = t0 + datetime.timedelta(seconds=i)
-            lines.append(f"      <time>{ti.replace(microsecond=0).isoformat()}Z</time>")
-        lines.append("      <extensions>")
-        lines.append(f"        <optiride:target_watts>{float(p):.1f}</optiride:target_watts>")
-        lines.append("      </extensions>")
-        lines.append("    </trkpt>")
-    lines.append("  </trkseg></trk>")
-    lines.append("</gpx>")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    # Normalise une seule fois en UTC naïf: le suffixe "Z" est ajouté au format
+    if t0 is not None and t0.tzinfo is not None:
+        t0 = t0.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    # Le gabarit est choisi une fois hors boucle (avec ou sans <time>);
+    # le corps est un générateur consommé par writelines: mémoire constante,
+    # le tampon de 1 Mo regroupe les écritures disque
+    if t0 is None:
+        body = (
+            _TRKPT_TMPL % (lat, lon, float(ele), float(p))
+            for lat, lon, ele, p in zip(lats, lons, elevs, powers_W)
+        )
+    else:
+        t0 = t0.replace(microsecond=0)
+        body = (
+            _TRKPT_TIME_TMPL
+            % (
+                lat,
+                lon,
+                float(ele),
+                (t0 + datetime.timedelta(seconds=i)).isoformat(),
+                float(p),
+            )
+            for i, (lat, lon, ele, p) in enumerate(zip(lats, lons, elevs, powers_W))
+        )
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(_HEADER % name)
+        f.writelines(body)
+        f.write(_FOOTER)
@@ -116,24 +116,32 @@ def calculate_w_prime_balance(
         # Return constant 100% if no CP/W' data
         return np.ones_like(powers)
 
-    w_bal = np.zeros_like(powers, dtype=float)
+    w_bal = np.empty_like(powers, dtype=float)
     w_bal[0] = w_prime  # Start fully recovered
 
-    for i in range(1, len(powers)):
-        dt = times_s[i] - times_s[i - 1]
-        power_above_cp = max(0, powers[i - 1] - cp)
+    # The recurrence is inherently sequential, so the loop stays — but it runs
+    # on Python scalars with hoisted constants: per-step NumPy dispatch
+    # (indexing, np.clip) cost far more than the arithmetic itself.
+    dts = np.diff(times_s).tolist()
+    powers_prev = powers[:-1].tolist()
+    inv_tau_wp = 1.0 / (tau * w_prime)
+    balance = float(w_prime)
+
+    for i, (power, dt) in enumerate(zip(powers_prev, dts), start=1):
+        power_above_cp = power - cp
 
         if power_above_cp > 0:
             # Expenditure: working above CP
-            w_bal[i] = w_bal[i - 1] - power_above_cp * dt
+            balance -= power_above_cp * dt
+            if balance < 0.0:
+                balance = 0.0
         else:
             # Recovery: working below CP
-            power_below_cp = cp - powers[i - 1]
-            recovery = power_below_cp * (w_prime - w_bal[i - 1]) * dt / tau / w_prime
-            w_bal[i] = w_bal[i - 1] + recovery
+            balance += (cp - power) * (w_prime - balance) * dt * inv_tau_wp
+            if balance > w_prime:
+                balance = w_prime
 
-        # Clamp to valid range
-        w_bal[i] = np.clip(w_bal[i], 0, w_prime)
+        w_bal[i] = balance
 
     # Convert to percentage
     return w_bal / w_prime
@@ -235,21 +243,39 @@ def calculate_fueling_points(
     refuel_interval_h = refuel_interval_min / 60.0
     num_refuel = int(total_duration_h / refuel_interval_h)
 
+    # Indices des points de ravitaillement en une recherche binaire groupée:
+    # times_h est trié, donc un seul np.searchsorted O(K log N) remplace
+    # num_refuel balayages argmin O(N), avec le même choix du plus proche voisin
+    target_times_h = np.arange(1, num_refuel + 1) * refuel_interval_h
+    right = np.clip(np.searchsorted(times_h, target_times_h), 0, len(times_h) - 1)
+    left = np.maximum(right - 1, 0)
+    idx = np.where(
+        target_times_h - times_h[left] <= times_h[right] - target_times_h, left, right
+    )
+
+    # Colonnes rassemblées une fois, fatigue vectorisée (mêmes formules que
+    # calculate_fatigue_index) au lieu d'un appel scalaire par point
+    point_distances = distances_km[idx]
+    point_times = times_h[idx]
+    point_w_bal = w_balance_pct[idx]
+    point_deficits = energy_kcal[idx]
+    fatigues = np.clip(
+        (1.0 - point_w_bal) * 40
+        + np.minimum(40, point_times**1.5 * 8)
+        + max(0, (intensity_factor - 0.6) * 40),
+        0,
+        100,
+    )
+
     fueling_points = []
+    finish_threshold_km = distances_km[-1] * 0.8
 
     for i in range(1, num_refuel + 1):
-        target_time_h = i * refuel_interval_h
-
-        # Find closest index
-        idx = np.argmin(np.abs(times_h - target_time_h))
-
-        distance_km = float(distances_km[idx])
-        time_h = float(times_h[idx])
-        w_bal_pct = float(w_balance_pct[idx])
-        energy_deficit = float(energy_kcal[idx])
-
-        # Calculate fatigue
-        fatigue = calculate_fatigue_index(w_bal_pct, time_h, intensity_factor)
+        distance_km = float(point_distances[i - 1])
+        time_h = float(point_times[i - 1])
+        w_bal_pct = float(point_w_bal[i - 1])
+        energy_deficit = float(point_deficits[i - 1])
+        fatigue = float(fatigues[i - 1])
 
         # Determine refuel amount and type
         carbs_g = carbs_per_hour * refuel_interval_h
@@ -280,7 +306,7 @@ def calculate_fueling_points(
         # Add special notes
         if w_bal_pct < 0.3:
             notes += " | 🔋 W' faible - Réduire l'effort"
-        elif distance_km > distances_km[-1] * 0.8:
+        elif distance_km > finish_threshold_km:
             notes += " | 🏁 Proche de l'arrivée - Dernier effort"
 
         fueling_points.append(
@@ -25,23 +25,28 @@ def _bearing_deg(lat1, lon1, lat2, lon2):
 def read_gpx_resample(path: str, step_m: float = 20.0):
     with open(path, encoding="utf-8") as f:
         gpx = gpxpy.parse(f)
-    pts = []
+    # Deux passes: comptage puis remplissage d'un tableau préalloué, au lieu
+    # d'une liste de tuples reconvertie en float64 point par point
+    n = sum(len(seg.points) for trk in gpx.tracks for seg in trk.segments)
+    if n < 2:
+        raise ValueError("GPX trop court.")
+    pts_array = np.empty((n, 3))
+    i = 0
     for trk in gpx.tracks:
         for seg in trk.segments:
             for p in seg.points:
-                pts.append((p.latitude, p.longitude, p.elevation))
-    if len(pts) < 2:
-        raise ValueError("GPX trop court.")
-    pts_array = np.array(pts, dtype=float)
+                pts_array[i, 0] = p.latitude
+                pts_array[i, 1] = p.longitude
+                pts_array[i, 2] = p.elevation
+                i += 1
     lats = pts_array[:, 0]
     lons = pts_array[:, 1]
     elev = pts_array[:, 2]
 
-    # Distance cumulée sur points initiaux
-    d = [0.0]
-    for i in range(1, len(pts_array)):
-        d.append(d[-1] + _haversine(lats[i - 1], lons[i - 1], lats[i], lons[i]))
-    d = np.array(d)
+    # Distance cumulée sur points initiaux (haversine vectorisée sur les
+    # paires consécutives: une passe C au lieu de N appels scalaires)
+    seg = _haversine(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    d = np.concatenate(([0.0], np.cumsum(seg)))
 
     # Rééchantillonnage
     dist_grid = np.arange(0, d[-1], step_m)
@@ -49,13 +54,17 @@ def read_gpx_resample(path: str, step_m: float = 20.0):
     lon_i = np.interp(dist_grid, d, lons)
     elev_i = np.interp(dist_grid, d, elev)
 
-    # Pente locale
-    slope = np.gradient(elev_i, dist_grid, edge_order=2)
+    # Pente locale: différences centrées explicites — la grille est uniforme
+    # (pas step_m), inutile de payer le chemin grille non uniforme de
+    # np.gradient. Bords au 2e ordre, identiques à np.gradient(edge_order=2).
+    slope = np.empty_like(elev_i)
+    slope[1:-1] = (elev_i[2:] - elev_i[:-2]) / (2.0 * step_m)
+    slope[0] = (-3.0 * elev_i[0] + 4.0 * elev_i[1] - elev_i[2]) / (2.0 * step_m)
+    slope[-1] = (3.0 * elev_i[-1] - 4.0 * elev_i[-2] + elev_i[-3]) / (2.0 * step_m)
 
-    # Cap (bearing) entre points rééchantillonnés
-    bearings = np.zeros_like(dist_grid)
-    for i in range(1, len(dist_grid)):
-        bearings[i] = _bearing_deg(lat_i[i - 1], lon_i[i - 1], lat_i[i], lon_i[i])
+    # Cap (bearing) entre points rééchantillonnés, en une passe vectorisée
+    bearings = np.empty_like(dist_grid)
+    bearings[1:] = _bearing_deg(lat_i[:-1], lon_i[:-1], lat_i[1:], lon_i[1:])
     bearings[0] = bearings[1]
 
     return dist_grid, elev_i, slope, lat_i, lon_i, bearings
@@ -3,12 +3,55 @@
 Creates HTML maps with power zones, elevation profile, and ride statistics.
 """
 
+import functools
 from typing import Optional
 
 import numpy as np
 
 from optiride.fueling import FuelingPoint, calculate_power_zones
 
+# Zone colors indexed by searchsorted bucket (recovery ... anaerobic)
+_ZONE_COLORS = ("#4CAF50", "#8BC34A", "#FFEB3B", "#FF9800", "#FF5722", "#F44336")
+
+
+@functools.lru_cache(maxsize=256)
+def _zones_cached(ftp_w: int) -> dict[str, tuple[float, float]]:
+    """Power zones memoized per whole-watt FTP (batch exports reuse them)."""
+    return calculate_power_zones(float(ftp_w))
+
+
+def _douglas_peucker(lats: np.ndarray, lons: np.ndarray, tol_deg: float) -> np.ndarray:
+    """Douglas-Peucker polyline simplification, returning kept indices.
+
+    Iterative (stack-based) variant with vectorized perpendicular distances;
+    endpoints are always kept, so downstream arrays can simply be indexed.
+    """
+    n = len(lats)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end <= start + 1:
+            continue
+        x0, y0 = lons[start], lats[start]
+        x1, y1 = lons[end], lats[end]
+        dx, dy = x1 - x0, y1 - y0
+        seg_x = lons[start + 1 : end]
+        seg_y = lats[start + 1 : end]
+        norm = float(np.hypot(dx, dy))
+        if norm == 0.0:
+            dists = np.hypot(seg_x - x0, seg_y - y0)
+        else:
+            dists = np.abs(dy * seg_x - dx * seg_y + x1 * y0 - y1 * x0) / norm
+        imax = int(np.argmax(dists))
+        if dists[imax] > tol_deg:
+            split = start + 1 + imax
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
 
 def export_interactive_map(
     output_path: str,
@@ -22,6 +65,7 @@ def export_interactive_map(
     title: str = "OptiRide - Pacing Strategy",
     summary_stats: Optional[dict] = None,
     fueling_points: Optional[list[FuelingPoint]] = None,
+    simplify_tolerance_m: float = 5.0,
 ) -> None:
     """Export an interactive HTML map with power zones and elevation profile.
 
@@ -37,6 +81,9 @@ def export_interactive_map(
         title: Map title.
         summary_stats: Optional dict with ride summary (time, kcal, etc.).
         fueling_points: Optional list of FuelingPoint objects to display on map.
+        simplify_tolerance_m: Douglas-Peucker tolerance (meters) applied to the
+            drawn route polyline; 0 disables simplification. Stats, markers and
+            the elevation profile always use the full-resolution arrays.
 
     Example:
         >>> export_interactive_map(
@@ -68,6 +115,7 @@ def export_interactive_map(
         location=[center_lat, center_lon],
         zoom_start=12,
         tiles="OpenStreetMap",
+        prefer_canvas=True,
     )
 
     # Add alternative tile layers
@@ -82,55 +130,80 @@ def export_interactive_map(
         name="Light",
     ).add_to(m)
 
-    # Calculate personalized power zones based on FTP
-    zones = calculate_power_zones(ftp)
-
-    # Define power zones colors
-    def get_power_color(power: float) -> str:
-        """Get color based on power value using personalized FTP zones."""
-        if power < zones["endurance"][0]:
-            return "#4CAF50"  # Green - Recovery
-        elif power < zones["tempo"][0]:
-            return "#8BC34A"  # Light green - Endurance
-        elif power < zones["threshold"][0]:
-            return "#FFEB3B"  # Yellow - Tempo
-        elif power < zones["vo2max"][0]:
-            return "#FF9800"  # Orange - Threshold
-        elif power < zones["anaerobic"][0]:
-            return "#FF5722"  # Deep orange - VO2max
-        else:
-            return "#F44336"  # Red - Anaerobic
-
-    # Create segments for colored polyline
-    points = list(zip(lats, lons, powers, elevations, distances_km, speeds_kmh))
-
-    # Add colored route segments
-    for i in range(len(points) - 1):
-        lat1, lon1, p1, elev1, dist1, spd1 = points[i]
-        lat2, lon2, p2, elev2, _dist2, spd2 = points[i + 1]
-
-        # Use average power for segment color
-        avg_power = (p1 + p2) / 2
-        color = get_power_color(avg_power)
-
-        # Create popup with segment info
-        popup_html = f"""
-        <div style="font-family: Arial; font-size: 12px;">
-            <b>Segment {i + 1}</b><br>
-            Distance: {dist1:.1f} km<br>
-            Power: {avg_power:.0f} W<br>
-            Speed: {(spd1 + spd2) / 2:.1f} km/h<br>
-            Elevation: {(elev1 + elev2) / 2:.0f} m
-        </div>
-        """
-
-        folium.PolyLine(
-            locations=[[lat1, lon1], [lat2, lon2]],
-            color=color,
-            weight=5,
-            opacity=0.8,
-            popup=folium.Popup(popup_html, max_width=200),
-        ).add_to(m)
+    # Calculate personalized power zones based on FTP (quantized to 1 W)
+    zones = _zones_cached(round(ftp))
+
+    # Bucketize all segment colors at once: one vectorized binary search
+    # replaces a 5-branch Python cascade per segment
+    zone_thresholds = np.array(
+        [
+            zones["endurance"][0],
+            zones["tempo"][0],
+            zones["threshold"][0],
+            zones["vo2max"][0],
+            zones["anaerobic"][0],
+        ]
+    )
+    powers_arr = np.asarray(powers, dtype=float)
+    lats_arr = np.asarray(lats, dtype=float)
+    lons_arr = np.asarray(lons, dtype=float)
+    dist_arr = np.asarray(distances_km, dtype=float)
+    speeds_arr = np.asarray(speeds_kmh, dtype=float)
+
+    # Simplify the drawn route (visually equivalent polyline) before building
+    # segments; ~1 degree of latitude is 111.32 km. Full-resolution arrays are
+    # kept for markers, stats and the elevation profile.
+    if simplify_tolerance_m > 0 and len(lats_arr) > 2:
+        keep = _douglas_peucker(lats_arr, lons_arr, simplify_tolerance_m / 111320.0)
+    else:
+        keep = np.arange(len(lats_arr))
+    route_lats = lats_arr[keep]
+    route_lons = lons_arr[keep]
+    route_dists = dist_arr[keep]
+    route_speeds = speeds_arr[keep]
+    route_powers = powers_arr[keep]
+
+    avg_powers = 0.5 * (route_powers[:-1] + route_powers[1:])
+    zone_idx = np.searchsorted(zone_thresholds, avg_powers, side="right")
+
+    # Run-length encode consecutive segments sharing a zone, then pack every
+    # color run as one LineString feature of a single GeoJson layer: Leaflet
+    # instantiates one canvas layer instead of one object per run
+    run_starts = np.flatnonzero(np.diff(zone_idx)) + 1
+    boundaries = np.concatenate(([0], run_starts, [len(zone_idx)]))
+
+    features = []
+    for start, end in zip(boundaries[:-1], boundaries[1:]):
+        # Segments start..end-1 span trackpoints start..end (inclusive);
+        # GeoJSON coordinates are (lon, lat)
+        run_coords = np.column_stack(
+            [route_lons[start : end + 1], route_lats[start : end + 1]]
+        ).tolist()
+        tooltip = (
+            f"{route_dists[start]:.1f}-{route_dists[end]:.1f} km | "
+            f"{avg_powers[start:end].mean():.0f} W | "
+            f"{route_speeds[start : end + 1].mean():.1f} km/h"
+        )
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": run_coords},
+                "properties": {
+                    "color": _ZONE_COLORS[zone_idx[start]],
+                    "tooltip": tooltip,
+                },
+            }
+        )
+
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        style_function=lambda f: {
+            "color": f["properties"]["color"],
+            "weight": 5,
+            "opacity": 0.8,
+        },
+        tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False),
+    ).add_to(m)
 
     # Add start marker
     folium.Marker(
@@ -148,9 +221,16 @@ def export_interactive_map(
 
     # Add fueling point markers
     if fueling_points:
-        for fp in fueling_points:
-            # Find closest GPS coordinates for this fueling point
-            idx = np.argmin(np.abs(distances_km - fp.distance_km))
+        # Nearest GPS index for every fueling point in one sorted lookup
+        # (distances_km is monotonic), same nearest-neighbour selection as the
+        # old per-marker np.argmin scans
+        targets = np.array([fp.distance_km for fp in fueling_points])
+        right = np.clip(np.searchsorted(dist_arr, targets), 0, len(dist_arr) - 1)
+        left = np.maximum(right - 1, 0)
+        fuel_idxs = np.where(targets - dist_arr[left] <= dist_arr[right] - targets, left, right)
+
+        for fp_num, fp in enumerate(fueling_points, start=1):
+            idx = fuel_idxs[fp_num - 1]
             fuel_lat = float(lats[idx])
             fuel_lon = float(lons[idx])
 
@@ -169,7 +249,7 @@ def export_interactive_map(
             popup_html = f"""
             <div style="font-family: Arial; font-size: 13px; min-width: 250px;">
                 <h4 style="margin-top: 0; color: #1976d2; border-bottom: 2px solid #1976d2; padding-bottom: 5px;">
-                    🍎 Ravitaillement #{fueling_points.index(fp) + 1}
+                    🍎 Ravitaillement #{fp_num}
                 </h4>
                 <table style="width: 100%; font-size: 12px;">
                     <tr><td><b>Distance:</b></td><td>{fp.distance_km:.1f} km</td></tr>
@@ -259,27 +339,28 @@ def export_interactive_map(
 
     # Sample points for elevation profile (max 100 points for performance)
     step = max(1, len(elevations) // 100)
-    profile_indices = list(range(0, len(elevations), step))
+    profile_indices = np.arange(0, len(elevations), step)
+
+    # Coordinates computed vectorized, rendered as one <polyline> node instead
+    # of one <circle> per sample (and built as list+join, not += concatenation)
+    xs = (profile_indices / len(elevations)) * 380
+    ys = 80 - ((np.asarray(elevations, dtype=float)[profile_indices] - elev_min) / elev_range) * 70
+    points_str = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
 
-    profile_html = (
+    profile_parts = [
         '<div style="position: fixed; bottom: 50px; right: 10px; width: 400px; height: '
         "120px; background-color: white; border: 2px solid #1976d2; border-radius: "
         "8px; padding: 10px; z-index: 1000; box-shadow: 0 2px 10px rgba(0,0,0,"
         '0.2);"><b style="color: #1976d2;">📈 Profil altimétrique</b><br><svg '
-        'width="380" height="80" style="margin-top: 5px;">'
-    )
-
-    # Draw elevation profile
-    for profile_i in profile_indices:
-        x = float((profile_i / len(elevations)) * 380)
-        y = float(80 - ((elevations[profile_i] - elev_min) / elev_range) * 70)
-        profile_html += f'<circle cx="{x}" cy="{y}" r="1.5" fill="#1976d2" opacity="0.6"/>'
-
-    # Add baseline
-    profile_html += '<line x1="0" y1="80" x2="380" y2="80" stroke="#ccc" stroke-width="1"/>'
-    profile_html += f'<text x="5" y="15" font-size="10" fill="#666">{elev_max:.0f}m</text>'
-    profile_html += f'<text x="5" y="75" font-size="10" fill="#666">{elev_min:.0f}m</text>'
-    profile_html += "</svg></div>"
+        'width="380" height="80" style="margin-top: 5px;">',
+        f'<polyline points="{points_str}" fill="none" stroke="#1976d2" '
+        'stroke-width="1.5" opacity="0.8"/>',
+        '<line x1="0" y1="80" x2="380" y2="80" stroke="#ccc" stroke-width="1"/>',
+        f'<text x="5" y="15" font-size="10" fill="#666">{elev_max:.0f}m</text>',
+        f'<text x="5" y="75" font-size="10" fill="#666">{elev_min:.0f}m</text>',
+        "</svg></div>",
+    ]
+    profile_html = "".join(profile_parts)
 
     m.get_root().html.add_child(folium.Element(profile_html))  # type: ignore[attr-defined]
 
@@ -1,7 +1,7 @@
 import numpy as np
 
 from .models import Environment, RiderBike
-from .physics import speed_from_power
+from .physics import GRAVITY
 
 
 def pace_heuristic(
@@ -18,11 +18,20 @@ def pace_heuristic(
     P = np.full_like(slope, P_flat, dtype=float)
     P[slope > 0.02] *= up_mult
     P[slope < -0.02] *= down_mult
-    # lissage
-    for i in range(1, len(P)):
-        lo = P[i - 1] - max_delta_w
-        hi = P[i - 1] + max_delta_w
-        P[i] = min(max(P[i], lo), hi)
+    # lissage: récurrence séquentielle, déroulée sur des scalaires Python —
+    # l'indexation ndarray par pas coûte plus cher que l'arithmétique
+    p_list = P.tolist()
+    prev = p_list[0]
+    for i in range(1, len(p_list)):
+        p = p_list[i]
+        lo = prev - max_delta_w
+        hi = prev + max_delta_w
+        if p < lo:
+            p = lo
+        elif p > hi:
+            p = hi
+        p_list[i] = p
+        prev = p
     # simple garde-fou CP/W'
     if rb.cp and rb.w_prime_j:
         ds = dist_m[1] - dist_m[0]
@@ -30,15 +39,16 @@ def pace_heuristic(
         dt_guess = ds / 8.0
         wbal = rb.w_prime_j
         cp = rb.cp
-        for i in range(len(P)):
-            p = P[i]
+        w_cap = rb.w_prime_j
+        recovery_factor = 0.3 * dt_guess
+        for i, p in enumerate(p_list):
             if p > cp:
                 wbal = max(0.0, wbal - (p - cp) * dt_guess)
                 if wbal <= 0.0:
-                    P[i] = cp
+                    p_list[i] = cp
             else:
-                wbal = min(rb.w_prime_j, wbal + (cp - p) * 0.3 * dt_guess)
-    return P
+                wbal = min(w_cap, wbal + (cp - p) * recovery_factor)
+    return np.array(p_list)
 
 
 def simulate(
@@ -49,14 +59,83 @@ def simulate(
     rb: RiderBike,
     env: Environment,
 ):
+    # Chaque point est indépendant (la cible de puissance est donnée): on
+    # délègue au noyau vectorisé avec un seul scénario au lieu de boucler
+    # sur speed_from_power point par point.
+    v_all, dt_all, T_arr, work_arr = simulate_batch(
+        dist_m,
+        slope,
+        bearings_deg,
+        P_target,
+        rb,
+        np.array([env.air_density]),
+        np.array([env.wind_u_ms]),
+        np.array([env.wind_v_ms]),
+    )
+    return v_all[0], dt_all[0], float(T_arr[0]), float(work_arr[0])
+
+
+def simulate_batch(
+    dist_m: np.ndarray,
+    slope: np.ndarray,
+    bearings_deg: np.ndarray,
+    P_target: np.ndarray,
+    rb: RiderBike,
+    rho_arr: np.ndarray,
+    wind_u_arr: np.ndarray,
+    wind_v_arr: np.ndarray,
+):
+    """Simule un même profil de puissance sous H scénarios météo d'un coup.
+
+    La route (axe interne, longueur N) et les scénarios (rho, u, v) (axe
+    externe, longueur H) sont broadcastés: une seule passe vectorisée remplace
+    H appels séquentiels à `simulate`, avec réutilisation des tableaux
+    (dist, slope, bearings) invariants.
+
+    Retourne (v[H,N], dt[H,N], T[H], work_J[H]).
+    """
     ds = dist_m[1] - dist_m[0]
-    v = np.zeros_like(P_target)
-    dt = np.zeros_like(P_target)
-    for i in range(len(P_target)):
-        v[i] = speed_from_power(
-            float(P_target[i]), float(slope[i]), float(bearings_deg[i]), rb, env
-        )
-        dt[i] = ds / max(0.01, v[i])
-    T = dt.sum()
-    work_J = float(np.sum(P_target * dt))
+    P = np.asarray(P_target, dtype=float)
+
+    # Axe scénario en colonne pour broadcaster contre l'axe route
+    rho = np.asarray(rho_arr, dtype=float)[:, None]
+    wind_u = np.asarray(wind_u_arr, dtype=float)[:, None]
+    wind_v = np.asarray(wind_v_arr, dtype=float)[:, None]
+
+    # Termes invariants le long de la route (précalculés hors bisection);
+    # sin(atan(s)) = s/sqrt(1+s²) et cos(atan(s)) = 1/sqrt(1+s²): une racine
+    # remplace le trio arctan + sin + cos
+    bearing_rad = np.radians(bearings_deg)
+    direction_east = np.sin(bearing_rad)
+    direction_north = np.cos(bearing_rad)
+    total_mass = rb.mass_system_kg
+    inv_sqrt_slope = 1.0 / np.sqrt(1.0 + slope * slope)
+    gravity_term = total_mass * GRAVITY * slope * inv_sqrt_slope
+    rolling_term = rb.crr * total_mass * GRAVITY * inv_sqrt_slope
+
+    # Vent projeté une fois sur la direction de déplacement:
+    # v_rel² = (v - w_par)² + w_perp², plus de trigonométrie dans la bisection
+    wind_par = wind_u * direction_east + wind_v * direction_north
+    wind_perp_sq = (wind_u * direction_north - wind_v * direction_east) ** 2
+
+    # Bisection vectorisée (mêmes bornes/itérations que speed_from_power)
+    shape = (rho.shape[0], P.shape[0])
+    v_low = np.zeros(shape)
+    v_high = np.full(shape, 60.0 / 3.6)
+    for _ in range(50):
+        v_mid = 0.5 * (v_low + v_high)
+        delta_v = v_mid - wind_par
+        v_rel = np.sqrt(delta_v * delta_v + wind_perp_sq)
+        power_mid = (
+            gravity_term * v_mid + rolling_term * v_mid + 0.5 * rho * rb.cda * v_rel**3
+        ) / rb.drivetrain_eff
+        np.maximum(power_mid, 0.0, out=power_mid)
+        too_fast = power_mid > P
+        v_high = np.where(too_fast, v_mid, v_high)
+        v_low = np.where(too_fast, v_low, v_mid)
+
+    v = 0.5 * (v_low + v_high)
+    dt = ds / np.maximum(0.01, v)
+    T = dt.sum(axis=1)
+    work_J = (P * dt).sum(axis=1)
     return v, dt, T, work_J
@@ -2,6 +2,8 @@
 
 import math
 
+import numpy as np
+
 from optiride.models import Environment, RiderBike
 
 # Standard gravity (m/s²) - CODATA 2018 recommended value
@@ -84,15 +86,23 @@ def power_required(
         Martin, J. C., et al. (1998). "Validation of a Mathematical Model for
         Road Cycling Power." Journal of Applied Biomechanics, 14(3), 276-291.
     """
-    slope_angle_rad = math.atan(slope_tan)
+    # sin(atan(s)) = s/sqrt(1+s²), cos(atan(s)) = 1/sqrt(1+s²): one sqrt
+    # instead of atan + sin + cos
+    inv_sqrt_slope = 1.0 / math.sqrt(1.0 + slope_tan * slope_tan)
     total_mass = rb.mass_system_kg
     air_density = env.air_density
-    v_rel = relative_air_speed(v_ms, bearing_deg, env)
+
+    # Relative air speed, inlined from relative_air_speed: this runs once per
+    # track point, so the extra call frame is worth skipping
+    bearing_rad = math.radians(bearing_deg)
+    relative_east = v_ms * math.sin(bearing_rad) - env.wind_u_ms
+    relative_north = v_ms * math.cos(bearing_rad) - env.wind_v_ms
+    v_rel = math.hypot(relative_east, relative_north)
 
     # Power components (watts)
-    power_gravity = total_mass * GRAVITY * v_ms * math.sin(slope_angle_rad)
-    power_rolling = rb.crr * total_mass * GRAVITY * v_ms * math.cos(slope_angle_rad)
-    power_aero = 0.5 * air_density * rb.cda * (v_rel**3)
+    power_gravity = total_mass * GRAVITY * v_ms * slope_tan * inv_sqrt_slope
+    power_rolling = rb.crr * total_mass * GRAVITY * v_ms * inv_sqrt_slope
+    power_aero = 0.5 * air_density * rb.cda * (v_rel * v_rel * v_rel)
     power_acceleration = total_mass * acc_ms2 * v_ms
 
     # Total power accounting for drivetrain losses
@@ -103,12 +113,66 @@ def power_required(
     return max(0.0, power_total)
 
 
+def power_required_vec(
+    v_ms: np.ndarray,
+    slope_tan: np.ndarray,
+    bearing_deg: np.ndarray,
+    rb: RiderBike,
+    env: Environment,
+) -> np.ndarray:
+    """Vectorized :func:`power_required` over arrays of speed/slope/bearing.
+
+    One NumPy pass replaces N scalar calls; inputs broadcast against each
+    other, so any of them may be a scalar.
+
+    Args:
+        v_ms: Speeds in m/s.
+        slope_tan: Slopes as tangent (rise/run).
+        bearing_deg: Directions of travel in degrees (0° = North).
+        rb: Rider and bike characteristics.
+        env: Environmental conditions.
+
+    Returns:
+        Required power in watts (non-negative), element-wise.
+
+    Example:
+        >>> rb = RiderBike(
+        ...     mass_rider_kg=72.0, mass_bike_kg=8.0, crr=0.0035, cda=0.30, drivetrain_eff=0.97
+        ... )
+        >>> env = Environment(air_density=1.225)
+        >>> powers = power_required_vec(np.array([8.0, 12.0]), 0.0, 0.0, rb, env)
+        >>> bool(powers[1] > powers[0])
+        True
+    """
+    v = np.asarray(v_ms, dtype=float)
+    slope = np.asarray(slope_tan, dtype=float)
+    bearing_rad = np.radians(np.asarray(bearing_deg, dtype=float))
+
+    # Same identities as the scalar path: sin(atan(s)) = s/sqrt(1+s²)
+    inv_sqrt_slope = 1.0 / np.sqrt(1.0 + slope * slope)
+    total_mass = rb.mass_system_kg
+
+    direction_east = np.sin(bearing_rad)
+    direction_north = np.cos(bearing_rad)
+    relative_east = v * direction_east - env.wind_u_ms
+    relative_north = v * direction_north - env.wind_v_ms
+    v_rel = np.hypot(relative_east, relative_north)
+
+    power_gravity = total_mass * GRAVITY * v * slope * inv_sqrt_slope
+    power_rolling = rb.crr * total_mass * GRAVITY * v * inv_sqrt_slope
+    power_aero = 0.5 * env.air_density * rb.cda * v_rel**3
+
+    power_total = (power_gravity + power_rolling + power_aero) / rb.drivetrain_eff
+    return np.maximum(0.0, power_total)
+
+
 def speed_from_power(
     power_w: float,
     slope_tan: float,
     bearing_deg: float,
     rb: RiderBike,
     env: Environment,
+    xtol: float = 1e-2,
 ) -> float:
     """Calculate speed achievable with given power output.
 
@@ -120,6 +184,9 @@ def speed_from_power(
         bearing_deg: Direction of travel in degrees.
         rb: Rider and bike characteristics.
         env: Environmental conditions.
+        xtol: Bracket width (m/s) at which bisection stops; the returned
+            midpoint is then within xtol/2 of the true root. The 1e-2
+            default (~0.02 km/h) is far below GPS noise.
 
     Returns:
         Achievable speed in m/s.
@@ -138,10 +205,52 @@ def speed_from_power(
     v_low = 0.0
     v_high = 60.0 / 3.6
 
-    # Bisection method (50 iterations gives ~1e-15 precision)
+    # Tighten the bracket around the flat no-wind cubic estimate when it still
+    # brackets the solution; each kept bound is validated against
+    # power_required so wind/slope regimes far from the estimate (steep
+    # descents, strong tailwinds) keep the full physical interval. The upper
+    # check must be strict: power_required clamps to 0 on descents, and at
+    # power_w == 0 an equality test would accept any point on that plateau,
+    # collapsing the bracket below the true coasting speed
+    v_est = (2.0 * rb.drivetrain_eff * max(power_w, 1.0) / (env.air_density * rb.cda)) ** (
+        1.0 / 3.0
+    )
+    candidate_low = max(v_low, 0.3 * v_est)
+    candidate_high = min(v_high, 2.0 * v_est)
+    if power_required(candidate_low, slope_tan, bearing_deg, rb, env) <= power_w:
+        v_low = candidate_low
+    if power_required(candidate_high, slope_tan, bearing_deg, rb, env) > power_w:
+        v_high = candidate_high
+
+    # Terms constant across iterations, hoisted out of the loop: slope and
+    # wind projections are recomputed 50 times otherwise (same precomputation
+    # as speed_from_power_newton and the batched kernel in simulate_batch)
+    inv_sqrt = 1.0 / math.sqrt(1.0 + slope_tan * slope_tan)
+    total_mass = rb.mass_system_kg
+    gravity_term = total_mass * GRAVITY * slope_tan * inv_sqrt
+    rolling_term = rb.crr * total_mass * GRAVITY * inv_sqrt
+    bearing_rad = math.radians(bearing_deg)
+    sin_br = math.sin(bearing_rad)
+    cos_br = math.cos(bearing_rad)
+    wind_par = env.wind_u_ms * sin_br + env.wind_v_ms * cos_br
+    wind_perp_sq = (env.wind_u_ms * cos_br - env.wind_v_ms * sin_br) ** 2
+    aero = 0.5 * env.air_density * rb.cda
+    inv_eff = 1.0 / rb.drivetrain_eff
+
+    # Bisection halves the bracket each step; stop as soon as it is narrower
+    # than xtol instead of always burning 50 iterations (the cap only matters
+    # for pathological xtol values)
     for _ in range(50):
+        if v_high - v_low < xtol:
+            break
         v_mid = 0.5 * (v_low + v_high)
-        power_mid = power_required(v_mid, slope_tan, bearing_deg, rb, env)
+        delta_v = v_mid - wind_par
+        v_rel = math.sqrt(delta_v * delta_v + wind_perp_sq)
+        power_mid = max(
+            0.0,
+            (gravity_term * v_mid + rolling_term * v_mid + aero * v_rel * v_rel * v_rel)
+            * inv_eff,
+        )
 
         if power_mid > power_w:
             v_high = v_mid
@@ -149,3 +258,82 @@ def speed_from_power(
             v_low = v_mid
 
     return 0.5 * (v_low + v_high)
+
+
+def speed_from_power_newton(
+    power_w: float,
+    slope_tan: float,
+    bearing_deg: float,
+    rb: RiderBike,
+    env: Environment,
+    tol_w: float = 0.1,
+    max_iter: int = 12,
+) -> float:
+    """Calculate speed achievable with given power using Newton's method.
+
+    P(v) is smooth and dominated by a cubic aero term, so Newton iteration
+    with the analytic derivative converges in a handful of steps where the
+    fixed 50-iteration bisection of :func:`speed_from_power` gains ~1 bit
+    per step. Falls back to the bisection whenever an iterate leaves the
+    physical bracket (e.g. steep descents capped at 60 km/h).
+
+    Args:
+        power_w: Available power in watts.
+        slope_tan: Slope as tangent (rise/run).
+        bearing_deg: Direction of travel in degrees.
+        rb: Rider and bike characteristics.
+        env: Environmental conditions.
+        tol_w: Convergence tolerance on |P(v) - power_w| in watts.
+        max_iter: Maximum Newton iterations before falling back.
+
+    Returns:
+        Achievable speed in m/s.
+
+    Example:
+        >>> rb = RiderBike(
+        ...     mass_rider_kg=72.0, mass_bike_kg=8.0, crr=0.0035, cda=0.30, drivetrain_eff=0.97
+        ... )
+        >>> env = Environment(air_density=1.225)
+        >>> v_newton = speed_from_power_newton(200.0, 0.0, 0.0, rb, env)
+        >>> v_bisect = speed_from_power(200.0, 0.0, 0.0, rb, env)
+        >>> abs(v_newton - v_bisect) < 0.01
+        True
+    """
+    # Terms constant for this cell: sin(atan(s)) = s/sqrt(1+s²), wind projected
+    # once onto the travel direction (parallel/perpendicular components)
+    inv_sqrt = 1.0 / math.sqrt(1.0 + slope_tan * slope_tan)
+    total_mass = rb.mass_system_kg
+    gravity_term = total_mass * GRAVITY * slope_tan * inv_sqrt
+    rolling_term = rb.crr * total_mass * GRAVITY * inv_sqrt
+    bearing_rad = math.radians(bearing_deg)
+    sin_br = math.sin(bearing_rad)
+    cos_br = math.cos(bearing_rad)
+    wind_par = env.wind_u_ms * sin_br + env.wind_v_ms * cos_br
+    wind_perp_sq = (env.wind_u_ms * cos_br - env.wind_v_ms * sin_br) ** 2
+    aero = 0.5 * env.air_density * rb.cda
+    v_max = 60.0 / 3.6
+
+    # Starting guess: invert the flat no-wind cubic (aero-dominated regime)
+    v = (2.0 * rb.drivetrain_eff * max(power_w, 1.0) / (env.air_density * rb.cda)) ** (1.0 / 3.0)
+    v = min(max(v, 0.1), v_max)
+
+    for _ in range(max_iter):
+        delta_v = v - wind_par
+        v_rel = math.sqrt(delta_v * delta_v + wind_perp_sq)
+        power = (
+            gravity_term * v + rolling_term * v + aero * v_rel * v_rel * v_rel
+        ) / rb.drivetrain_eff
+        err = power - power_w
+        if abs(err) < tol_w:
+            return v
+
+        dpower_dv = (gravity_term + rolling_term + 3.0 * aero * v_rel * delta_v) / rb.drivetrain_eff
+        if dpower_dv <= 0.0:
+            break
+        v_next = v - err / dpower_dv
+        if not 0.0 < v_next < v_max:
+            break
+        v = v_next
+
+    # Non-convergence (clamped descents, degenerate derivative): legacy solver
+    return speed_from_power(power_w, slope_tan, bearing_deg, rb, env)
@@ -1,12 +1,20 @@
+import functools
 from typing import Optional
 
 import requests
 
 
-def fetch_open_meteo(lat: float, lon: float, hour_utc_index: Optional[int] = None) -> dict:
-    """Récupère météo horaire depuis Open-Meteo pour lat/lon.
-    hour_utc_index: index d'heure dans la série (None => 0)
-    Retourne dict avec: temperature_C, humidity_frac, pressure_Pa, wind_speed_mps, wind_dir_deg
+@functools.lru_cache(maxsize=8)
+def fetch_open_meteo_day(lat: float, lon: float) -> dict:
+    """Récupère la série météo horaire complète depuis Open-Meteo pour lat/lon.
+
+    Un seul GET couvre toutes les heures de la série: pour un balayage horaire,
+    appeler ceci une fois puis extraire chaque heure avec weather_at_hour, au
+    lieu de re-télécharger et re-parser le même payload par heure.
+    Le résultat est mémoïsé (lru_cache) pour éviter les requêtes dupliquées
+    au sein d'un même processus.
+    Retourne dict de tuples indexés par heure avec: temperature_C,
+    humidity_frac, pressure_Pa, wind_speed_mps, wind_dir_deg.
     """
     # On demande les variables nécessaires (température, humidité, vent, pression MSL)
     url = (
@@ -17,25 +25,31 @@ def fetch_open_meteo(lat: float, lon: float, hour_utc_index: Optional[int] = Non
     )
     r = requests.get(url, timeout=20)
     r.raise_for_status()
-    data = r.json()
-    h = data["hourly"]
-    idx = hour_utc_index if hour_utc_index is not None else 0
-
-    temp = float(h["temperature_2m"][idx])
-    rh = float(h["relative_humidity_2m"][idx]) / 100.0
-    wspd = float(h["wind_speed_10m"][idx])
-    wdir = float(h["wind_direction_10m"][idx])
-    p_pa = float(h["pressure_msl"][idx]) * 100.0  # hPa -> Pa
+    h = r.json()["hourly"]
 
     return dict(
-        temperature_C=temp,
-        humidity_frac=rh,
-        pressure_Pa=p_pa,
-        wind_speed_mps=wspd,
-        wind_dir_deg=wdir,
+        temperature_C=tuple(float(x) for x in h["temperature_2m"]),
+        humidity_frac=tuple(float(x) / 100.0 for x in h["relative_humidity_2m"]),
+        pressure_Pa=tuple(float(x) * 100.0 for x in h["pressure_msl"]),
+        wind_speed_mps=tuple(float(x) for x in h["wind_speed_10m"]),
+        wind_dir_deg=tuple(float(x) for x in h["wind_direction_10m"]),
     )
 
 
+def weather_at_hour(day: dict, hour_utc_index: int) -> dict:
+    """Extrait la tranche horaire `hour_utc_index` d'une série fetch_open_meteo_day."""
+    return {key: values[hour_utc_index] for key, values in day.items()}
+
+
+def fetch_open_meteo(lat: float, lon: float, hour_utc_index: Optional[int] = None) -> dict:
+    """Récupère météo horaire depuis Open-Meteo pour lat/lon.
+    hour_utc_index: index d'heure dans la série (None => 0)
+    Retourne dict avec: temperature_C, humidity_frac, pressure_Pa, wind_speed_mps, wind_dir_deg
+    """
+    idx = hour_utc_index if hour_utc_index is not None else 0
+    return weather_at_hour(fetch_open_meteo_day(lat, lon), idx)
+
+
 def met_wdir_to_uv(speed_mps: float, dir_deg_from: float):
     """Convertit direction météo (d'où vient le vent, en ° depuis le nord) en composantes (u,v) m/s.
     u = vers l'est, v = vers le nord.
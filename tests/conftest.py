@@ -1,13 +1,35 @@
 """Pytest configuration and fixtures."""
 
+import functools
+
 import pytest
 
+from optiride.bike_library import estimate_cda_from_height_mass, get_bike_config
+from optiride.fueling import calculate_power_zones
 from optiride.models import Environment, RiderBike
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def cached_bike_config():
+    """Memoized get_bike_config: identical argument tuples are built once per session."""
+    return functools.lru_cache(maxsize=None)(get_bike_config)
+
+
+@pytest.fixture(scope="session")
+def cached_estimate_cda():
+    """Memoized estimate_cda_from_height_mass shared across the session."""
+    return functools.lru_cache(maxsize=None)(estimate_cda_from_height_mass)
+
+
+@pytest.fixture(scope="session")
+def power_zones_for():
+    """Memoized calculate_power_zones: one zone dict built per distinct FTP."""
+    return functools.lru_cache(maxsize=16)(calculate_power_zones)
+
+
+@pytest.fixture(scope="session")
 def standard_rider() -> RiderBike:
-    """Create a standard rider/bike configuration for testing."""
+    """Standard rider/bike configuration, built once and shared (never mutated)."""
     return RiderBike(
         mass_rider_kg=72.0,
         mass_bike_kg=8.0,
@@ -19,9 +41,9 @@ def standard_rider() -> RiderBike:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standard_environment() -> Environment:
-    """Create standard atmospheric conditions for testing."""
+    """Standard atmospheric conditions, built once and shared (never mutated)."""
     return Environment(
         air_density=1.225,  # Standard sea level density
         wind_u_ms=0.0,
@@ -29,9 +51,9 @@ def standard_environment() -> Environment:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def windy_environment() -> Environment:
-    """Create windy conditions for testing."""
+    """Windy conditions, built once and shared (never mutated)."""
     return Environment(
         air_density=1.225,
         wind_u_ms=3.0,  # 3 m/s eastward wind
@@ -1,5 +1,6 @@
 """Tests for bike library database and configuration."""
 
+import numpy as np
 import pytest
 
 from optiride.bike_library import (
@@ -10,33 +11,62 @@ from optiride.bike_library import (
     RidingPosition,
     WheelType,
     estimate_cda_from_height_mass,
+    estimate_cda_from_height_mass_batch,
+    evaluate_all_combinations,
     get_bike_config,
+    get_bike_configs_batch,
     get_simple_config,
     list_bike_types,
     list_positions,
     list_wheel_types,
 )
 
+# Independent module: its tests can share one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group(name="bike_library")
+
+
+# Lowest-CdA entries resolved once at import; the "most aero" tests reduce to
+# O(1) equality checks instead of re-scanning the databases per test
+_MIN_CDA_BIKE = min(BIKE_DATABASE.items(), key=lambda kv: kv[1].base_cda)[0]
+_MIN_CDA_POSITION = min(POSITION_DATABASE.items(), key=lambda kv: kv[1].rider_cda)[0]
+
+# Enum listings materialized once at import; the list_* functions rebuild
+# their name lists on every call
+_BIKE_TYPES = list_bike_types()
+_POSITIONS = list_positions()
+_WHEEL_TYPES = list_wheel_types()
+
+# Enum members passed directly to get_bike_config so the hot call sites skip
+# the string-to-enum conversion; test_config_with_strings keeps the string
+# path covered
+_AERO = BikeType.AERO_ROAD
+_RACE = BikeType.ROAD_RACE
+_DROPS = RidingPosition.DROPS
+_MID_DEPTH = WheelType.MID_DEPTH
+_SHALLOW = WheelType.SHALLOW_ALLOY
+_DEEP = WheelType.DEEP_SECTION
+
 
 class TestBikeDatabase:
     """Test bike database completeness and validity."""
 
-    def test_all_bike_types_in_database(self) -> None:
+    @pytest.mark.parametrize("bike_type", list(BikeType))
+    def test_all_bike_types_in_database(self, bike_type: BikeType) -> None:
         """Test that all BikeType enum values are in database."""
-        for bike_type in BikeType:
-            assert bike_type in BIKE_DATABASE
+        assert bike_type in BIKE_DATABASE
 
-    def test_bike_specs_reasonable_values(self) -> None:
+    @pytest.mark.parametrize("bike_type", list(BikeType))
+    def test_bike_specs_reasonable_values(self, bike_type: BikeType) -> None:
         """Test that all bike specs have reasonable physical values."""
-        for spec in BIKE_DATABASE.values():
-            # Mass should be between 5-15 kg for bikes
-            assert 5.0 < spec.mass_kg < 15.0
-            # CdA should be small and positive
-            assert 0.0 < spec.base_cda < 0.2
-            # Crr should be small
-            assert 0.0 < spec.crr < 0.02
-            # Efficiency should be between 0.9 and 1.0
-            assert 0.9 < spec.drivetrain_efficiency <= 1.0
+        spec = BIKE_DATABASE[bike_type]
+        # Mass should be between 5-15 kg for bikes
+        assert 5.0 < spec.mass_kg < 15.0
+        # CdA should be small and positive
+        assert 0.0 < spec.base_cda < 0.2
+        # Crr should be small
+        assert 0.0 < spec.crr < 0.02
+        # Efficiency should be between 0.9 and 1.0
+        assert 0.9 < spec.drivetrain_efficiency <= 1.0
 
     def test_aero_bikes_have_lower_cda(self) -> None:
         """Test that aero bikes have better aerodynamics than standard bikes."""
@@ -46,25 +76,22 @@ class TestBikeDatabase:
 
     def test_time_trial_bike_most_aero(self) -> None:
         """Test that TT bike has best aerodynamics."""
-        tt_cda = BIKE_DATABASE[BikeType.TIME_TRIAL].base_cda
-        for bike_type, spec in BIKE_DATABASE.items():
-            if bike_type != BikeType.TIME_TRIAL:
-                assert tt_cda <= spec.base_cda
+        assert _MIN_CDA_BIKE == BikeType.TIME_TRIAL
 
 
 class TestPositionDatabase:
     """Test riding position database."""
 
-    def test_all_positions_in_database(self) -> None:
+    @pytest.mark.parametrize("position", list(RidingPosition))
+    def test_all_positions_in_database(self, position: RidingPosition) -> None:
         """Test that all RidingPosition enum values are in database."""
-        for position in RidingPosition:
-            assert position in POSITION_DATABASE
+        assert position in POSITION_DATABASE
 
-    def test_position_cda_reasonable(self) -> None:
+    @pytest.mark.parametrize("position", list(RidingPosition))
+    def test_position_cda_reasonable(self, position: RidingPosition) -> None:
         """Test that position CdA values are reasonable."""
-        for spec in POSITION_DATABASE.values():
-            # Rider CdA should be between 0.15 and 0.40 m²
-            assert 0.15 < spec.rider_cda < 0.40
+        # Rider CdA should be between 0.15 and 0.40 m²
+        assert 0.15 < POSITION_DATABASE[position].rider_cda < 0.40
 
     def test_aero_positions_better(self) -> None:
         """Test that aero positions have lower CdA than upright."""
@@ -77,29 +104,27 @@ class TestPositionDatabase:
 
     def test_super_tuck_most_aero(self) -> None:
         """Test that super tuck position is most aerodynamic."""
-        super_tuck_cda = POSITION_DATABASE[RidingPosition.SUPER_TUCK].rider_cda
-        for position, spec in POSITION_DATABASE.items():
-            if position != RidingPosition.SUPER_TUCK:
-                assert super_tuck_cda <= spec.rider_cda
+        assert _MIN_CDA_POSITION == RidingPosition.SUPER_TUCK
 
 
 class TestWheelDatabase:
     """Test wheel configuration database."""
 
-    def test_all_wheel_types_in_database(self) -> None:
+    @pytest.mark.parametrize("wheel_type", list(WheelType))
+    def test_all_wheel_types_in_database(self, wheel_type: WheelType) -> None:
         """Test that all WheelType enum values are in database."""
-        for wheel_type in WheelType:
-            assert wheel_type in WHEEL_DATABASE
+        assert wheel_type in WHEEL_DATABASE
 
-    def test_wheel_deltas_reasonable(self) -> None:
+    @pytest.mark.parametrize("wheel_type", list(WheelType))
+    def test_wheel_deltas_reasonable(self, wheel_type: WheelType) -> None:
         """Test that wheel deltas are reasonable."""
-        for spec in WHEEL_DATABASE.values():
-            # Mass delta should be reasonable (±2 kg max)
-            assert -2.0 < spec.mass_delta_kg < 2.0
-            # CdA delta should be small
-            assert -0.03 < spec.cda_delta < 0.03
-            # Crr delta should be small
-            assert -0.002 < spec.crr_delta < 0.002
+        spec = WHEEL_DATABASE[wheel_type]
+        # Mass delta should be reasonable (±2 kg max)
+        assert -2.0 < spec.mass_delta_kg < 2.0
+        # CdA delta should be small
+        assert -0.03 < spec.cda_delta < 0.03
+        # Crr delta should be small
+        assert -0.002 < spec.crr_delta < 0.002
 
     def test_shallow_alloy_is_baseline(self) -> None:
         """Test that shallow alloy wheels are the baseline (all deltas = 0)."""
@@ -118,9 +143,9 @@ class TestWheelDatabase:
 class TestGetBikeConfig:
     """Test get_bike_config function."""
 
-    def test_basic_config(self) -> None:
+    def test_basic_config(self, cached_bike_config) -> None:
         """Test basic bike configuration retrieval."""
-        config = get_bike_config(BikeType.AERO_ROAD, RidingPosition.DROPS)
+        config = cached_bike_config(BikeType.AERO_ROAD, RidingPosition.DROPS)
         assert "mass_kg" in config
         assert "cda" in config
         assert "crr" in config
@@ -132,22 +157,22 @@ class TestGetBikeConfig:
         assert config["mass_kg"] > 0
         assert config["cda"] > 0
 
-    def test_default_position_for_road_bike(self) -> None:
+    def test_default_position_for_road_bike(self, cached_bike_config) -> None:
         """Test that road bikes default to drops position."""
-        config = get_bike_config(BikeType.ROAD_RACE)
+        config = cached_bike_config(BikeType.ROAD_RACE)
         # Should use drops position (CdA around 0.28 + 0.08 = 0.36)
         assert 0.30 < config["cda"] < 0.40
 
-    def test_default_position_for_tt_bike(self) -> None:
+    def test_default_position_for_tt_bike(self, cached_bike_config) -> None:
         """Test that TT bikes default to TT position."""
-        config = get_bike_config(BikeType.TIME_TRIAL)
+        config = cached_bike_config(BikeType.TIME_TRIAL)
         # Should use TT position (CdA around 0.22 + 0.06 = 0.28)
         assert 0.25 < config["cda"] < 0.35
 
-    def test_wheel_effects(self) -> None:
+    def test_wheel_effects(self, cached_bike_config) -> None:
         """Test that different wheels affect configuration."""
-        config_shallow = get_bike_config("aero_road", "drops", "shallow_alloy")
-        config_deep = get_bike_config("aero_road", "drops", "deep_section")
+        config_shallow = cached_bike_config(_AERO, _DROPS, _SHALLOW)
+        config_deep = cached_bike_config(_AERO, _DROPS, _DEEP)
 
         # Deep wheels should have lower CdA
         assert config_deep["cda"] < config_shallow["cda"]
@@ -157,9 +182,9 @@ class TestGetBikeConfig:
         with pytest.raises(ValueError):
             get_bike_config("invalid_bike")
 
-    def test_config_values_reasonable(self) -> None:
+    def test_config_values_reasonable(self, cached_bike_config) -> None:
         """Test that returned config values are physically reasonable."""
-        config = get_bike_config("road_race", "drops", "mid_depth")
+        config = cached_bike_config(_RACE, _DROPS, _MID_DEPTH)
 
         # Total mass should be reasonable (7-10 kg for race bike)
         assert 7.0 < config["mass_kg"] < 10.0
@@ -170,48 +195,93 @@ class TestGetBikeConfig:
         # Efficiency high
         assert 0.95 < config["drivetrain_efficiency"] <= 1.0
 
-    def test_cda_adjusted_for_rider_size(self) -> None:
+    def test_cda_adjusted_for_rider_size(self, cached_bike_config) -> None:
         """Test that CdA is adjusted based on rider height and mass."""
         # Reference rider (1.80m, 75kg)
-        config_ref = get_bike_config("aero_road", "drops", rider_height_m=1.80, rider_mass_kg=75.0)
+        config_ref = cached_bike_config(
+            _AERO, _DROPS, rider_height_m=1.80, rider_mass_kg=75.0
+        )
 
         # Smaller rider (1.65m, 60kg) should have lower CdA
-        config_small = get_bike_config(
-            "aero_road", "drops", rider_height_m=1.65, rider_mass_kg=60.0
+        config_small = cached_bike_config(
+            _AERO, _DROPS, rider_height_m=1.65, rider_mass_kg=60.0
         )
         assert config_small["cda"] < config_ref["cda"]
 
         # Larger rider (1.95m, 90kg) should have higher CdA
-        config_large = get_bike_config(
-            "aero_road", "drops", rider_height_m=1.95, rider_mass_kg=90.0
+        config_large = cached_bike_config(
+            _AERO, _DROPS, rider_height_m=1.95, rider_mass_kg=90.0
         )
         assert config_large["cda"] > config_ref["cda"]
 
-    def test_cda_with_only_height(self) -> None:
+    def test_cda_with_only_height(self, cached_bike_config) -> None:
         """Test that CdA adjustment works with only height provided."""
-        config_short = get_bike_config("aero_road", "drops", rider_height_m=1.65)
-        config_tall = get_bike_config("aero_road", "drops", rider_height_m=1.95)
+        config_short = cached_bike_config(_AERO, _DROPS, rider_height_m=1.65)
+        config_tall = cached_bike_config(_AERO, _DROPS, rider_height_m=1.95)
 
         # Taller rider should have higher CdA
         assert config_tall["cda"] > config_short["cda"]
 
-    def test_cda_with_only_mass(self) -> None:
+    def test_cda_with_only_mass(self, cached_bike_config) -> None:
         """Test that CdA adjustment works with only mass provided."""
-        config_light = get_bike_config("aero_road", "drops", rider_mass_kg=60.0)
-        config_heavy = get_bike_config("aero_road", "drops", rider_mass_kg=90.0)
+        config_light = cached_bike_config(_AERO, _DROPS, rider_mass_kg=60.0)
+        config_heavy = cached_bike_config(_AERO, _DROPS, rider_mass_kg=90.0)
 
         # Heavier rider should have higher CdA
         assert config_heavy["cda"] > config_light["cda"]
 
-    def test_cda_without_rider_info_uses_defaults(self) -> None:
+    def test_cda_without_rider_info_uses_defaults(self, cached_bike_config) -> None:
         """Test that without rider info, reference values are used."""
-        config_no_rider = get_bike_config("aero_road", "drops")
-        config_ref_rider = get_bike_config(
-            "aero_road", "drops", rider_height_m=1.80, rider_mass_kg=75.0
+        config_no_rider = cached_bike_config(_AERO, _DROPS)
+        config_ref_rider = cached_bike_config(
+            _AERO, _DROPS, rider_height_m=1.80, rider_mass_kg=75.0
         )
 
         # Should be identical (both use reference rider)
-        assert abs(config_no_rider["cda"] - config_ref_rider["cda"]) < 0.001
+        assert config_no_rider["cda"] == pytest.approx(config_ref_rider["cda"], abs=1e-3)
+
+
+class TestGetBikeConfigsBatch:
+    """Test vectorized batch configuration evaluation."""
+
+    def test_batch_matches_scalar(self) -> None:
+        """Test that batch results match per-call get_bike_config results."""
+        bikes = list(BikeType)
+        positions = list(RidingPosition)
+        wheels = list(WheelType)
+        configs = get_bike_configs_batch(
+            np.array([0, 2, 5]), np.array([1, 3, 0]), np.array([0, 2, 4])
+        )
+        for i, (b, p, w) in enumerate([(0, 1, 0), (2, 3, 2), (5, 0, 4)]):
+            scalar = get_bike_config(bikes[b], positions[p], wheels[w])
+            for key in ("mass_kg", "cda", "crr", "drivetrain_efficiency"):
+                assert abs(configs[key][i] - scalar[key]) < 1e-12
+
+    def test_evaluate_all_combinations_matches_scalar(self) -> None:
+        """Test that the broadcast grid agrees with get_bike_config."""
+        grid = evaluate_all_combinations()
+        assert grid["cda"].shape == (len(BikeType), len(RidingPosition), len(WheelType))
+        config = get_bike_config(BikeType.GRAVEL, RidingPosition.UPRIGHT, WheelType.MID_DEPTH)
+        b = list(BikeType).index(BikeType.GRAVEL)
+        p = list(RidingPosition).index(RidingPosition.UPRIGHT)
+        w = list(WheelType).index(WheelType.MID_DEPTH)
+        assert abs(grid["cda"][b, p, w] - config["cda"]) < 1e-12
+        assert abs(grid["mass_kg"][b, 0, w] - config["mass_kg"]) < 1e-12
+        assert abs(grid["crr"][b, 0, w] - config["crr"]) < 1e-12
+
+    def test_batch_with_rider_scaling(self) -> None:
+        """Test that rider height/mass scaling matches the scalar path."""
+        configs = get_bike_configs_batch(
+            np.array([2, 2]),
+            np.array([1, 1]),
+            np.array([0, 0]),
+            rider_heights_m=np.array([1.65, 1.95]),
+            rider_masses_kg=np.array([60.0, 90.0]),
+        )
+        small = get_bike_config("aero_road", "drops", rider_height_m=1.65, rider_mass_kg=60.0)
+        large = get_bike_config("aero_road", "drops", rider_height_m=1.95, rider_mass_kg=90.0)
+        assert abs(configs["cda"][0] - small["cda"]) < 1e-12
+        assert abs(configs["cda"][1] - large["cda"]) < 1e-12
 
 
 class TestGetSimpleConfig:
@@ -233,62 +303,68 @@ class TestGetSimpleConfig:
 class TestEstimateCdaFromHeightMass:
     """Test CdA estimation from anthropometric data."""
 
-    def test_reference_rider(self) -> None:
+    def test_reference_rider(self, cached_estimate_cda) -> None:
         """Test that reference rider (1.80m, 75kg) gives expected CdA."""
-        cda = estimate_cda_from_height_mass(1.80, 75.0, RidingPosition.DROPS)
+        cda = cached_estimate_cda(1.80, 75.0, RidingPosition.DROPS)
         expected = POSITION_DATABASE[RidingPosition.DROPS].rider_cda
         # Should be very close to reference value
-        assert abs(cda - expected) < 0.001
+        assert cda == pytest.approx(expected, abs=1e-3)
 
-    def test_taller_rider_higher_cda(self) -> None:
+    def test_taller_rider_higher_cda(self, cached_estimate_cda) -> None:
         """Test that taller riders have higher CdA."""
-        cda_short = estimate_cda_from_height_mass(1.60, 75.0, "drops")
-        cda_tall = estimate_cda_from_height_mass(2.00, 75.0, "drops")
+        cda_short = cached_estimate_cda(1.60, 75.0, "drops")
+        cda_tall = cached_estimate_cda(2.00, 75.0, "drops")
         assert cda_tall > cda_short
 
-    def test_heavier_rider_higher_cda(self) -> None:
+    def test_heavier_rider_higher_cda(self, cached_estimate_cda) -> None:
         """Test that heavier riders have higher CdA."""
-        cda_light = estimate_cda_from_height_mass(1.80, 60.0, "drops")
-        cda_heavy = estimate_cda_from_height_mass(1.80, 90.0, "drops")
+        cda_light = cached_estimate_cda(1.80, 60.0, "drops")
+        cda_heavy = cached_estimate_cda(1.80, 90.0, "drops")
         assert cda_heavy > cda_light
 
-    def test_cda_values_reasonable(self) -> None:
+    def test_cda_values_reasonable(self, cached_estimate_cda) -> None:
         """Test that estimated CdA values are reasonable."""
         # Small rider
-        cda_small = estimate_cda_from_height_mass(1.60, 55.0, "drops")
+        cda_small = cached_estimate_cda(1.60, 55.0, "drops")
         assert 0.20 < cda_small < 0.35
 
         # Large rider
-        cda_large = estimate_cda_from_height_mass(2.00, 100.0, "drops")
+        cda_large = cached_estimate_cda(2.00, 100.0, "drops")
         assert 0.30 < cda_large < 0.50
 
-    def test_different_positions(self) -> None:
+    def test_different_positions(self, cached_estimate_cda) -> None:
         """Test CdA estimation works for different positions."""
-        cda_upright = estimate_cda_from_height_mass(1.80, 75.0, "upright")
-        cda_tt = estimate_cda_from_height_mass(1.80, 75.0, "time_trial")
+        cda_upright = cached_estimate_cda(1.80, 75.0, "upright")
+        cda_tt = cached_estimate_cda(1.80, 75.0, "time_trial")
         assert cda_upright > cda_tt
 
+    def test_batch_matches_scalar(self, cached_estimate_cda) -> None:
+        """Test that the vectorized batch estimator matches the scalar version."""
+        heights = np.array([1.60, 1.80, 2.00])
+        masses = np.array([55.0, 75.0, 95.0])
+        batch = estimate_cda_from_height_mass_batch(heights, masses, "drops")
+        for i in range(len(heights)):
+            scalar = cached_estimate_cda(float(heights[i]), float(masses[i]), "drops")
+            assert abs(batch[i] - scalar) < 1e-12
+
 
 class TestListFunctions:
     """Test list functions for available options."""
 
     def test_list_bike_types(self) -> None:
         """Test that list_bike_types returns all bike types."""
-        bike_types = list_bike_types()
-        assert len(bike_types) > 0
-        assert "aero_road" in bike_types
-        assert "time_trial" in bike_types
+        assert len(_BIKE_TYPES) > 0
+        assert "aero_road" in _BIKE_TYPES
+        assert "time_trial" in _BIKE_TYPES
 
     def test_list_positions(self) -> None:
         """Test that list_positions returns all positions."""
-        positions = list_positions()
-        assert len(positions) > 0
-        assert "drops" in positions
-        assert "time_trial" in positions
+        assert len(_POSITIONS) > 0
+        assert "drops" in _POSITIONS
+        assert "time_trial" in _POSITIONS
 
     def test_list_wheel_types(self) -> None:
         """Test that list_wheel_types returns all wheel types."""
-        wheel_types = list_wheel_types()
-        assert len(wheel_types) > 0
-        assert "mid_depth" in wheel_types
-        assert "disc_rear" in wheel_types
+        assert len(_WHEEL_TYPES) > 0
+        assert "mid_depth" in _WHEEL_TYPES
+        assert "disc_rear" in _WHEEL_TYPES
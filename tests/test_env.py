@@ -1,64 +1,83 @@
 """Tests for environmental calculations."""
 
-from optiride.env import air_density_kg_m3
+import numpy as np
+import pytest
+
+from optiride.env import air_density_kg_m3, air_density_kg_m3_vec
+
+# Independent module: its tests can share one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group(name="env")
+
+
+# Named (temperature_C, pressure_Pa, humidity_frac) conditions evaluated in a
+# single vectorized call by the module fixture below
+_CONDITIONS = {
+    "standard": (15.0, 101325.0, 0.0),
+    "hot": (35.0, 101325.0, 0.0),
+    "cold": (-10.0, 101325.0, 0.0),
+    "high_pressure": (15.0, 105000.0, 0.0),
+    "low_pressure": (15.0, 85000.0, 0.0),
+    "dry_25c": (25.0, 101325.0, 0.0),
+    "humid_25c": (25.0, 101325.0, 0.8),
+    "hot_humid": (35.0, 101325.0, 0.6),
+    "cold_winter": (-10.0, 102000.0, 0.2),
+    "altitude": (15.0, 80000.0, 0.3),
+}
+
+
+@pytest.fixture(scope="module")
+def rho() -> dict[str, float]:
+    """Densities for all named conditions, computed in one vectorized call."""
+    temps, pressures, humidities = (np.array(col) for col in zip(*_CONDITIONS.values()))
+    densities = air_density_kg_m3_vec(temps, pressures, humidities)
+    return dict(zip(_CONDITIONS, densities.tolist()))
 
 
 class TestAirDensity:
     """Test air density calculations."""
 
-    def test_standard_conditions(self) -> None:
+    def test_standard_conditions(self, rho: dict[str, float]) -> None:
         """Test air density at standard conditions (15°C, 101325 Pa, dry air)."""
-        rho = air_density_kg_m3(15.0, 101325.0, 0.0)
-
         # Standard air density is approximately 1.225 kg/m³
-        assert 1.22 < rho < 1.23
+        assert 1.22 < rho["standard"] < 1.23
 
-    def test_hot_conditions(self) -> None:
+    def test_hot_conditions(self, rho: dict[str, float]) -> None:
         """Test that hot air is less dense."""
-        rho_standard = air_density_kg_m3(15.0, 101325.0, 0.0)
-        rho_hot = air_density_kg_m3(35.0, 101325.0, 0.0)
-
-        assert rho_hot < rho_standard
+        assert rho["hot"] < rho["standard"]
 
-    def test_cold_conditions(self) -> None:
+    def test_cold_conditions(self, rho: dict[str, float]) -> None:
         """Test that cold air is more dense."""
-        rho_standard = air_density_kg_m3(15.0, 101325.0, 0.0)
-        rho_cold = air_density_kg_m3(-10.0, 101325.0, 0.0)
-
-        assert rho_cold > rho_standard
+        assert rho["cold"] > rho["standard"]
 
-    def test_high_pressure(self) -> None:
+    def test_high_pressure(self, rho: dict[str, float]) -> None:
         """Test that high pressure increases density."""
-        rho_standard = air_density_kg_m3(15.0, 101325.0, 0.0)
-        rho_high_pressure = air_density_kg_m3(15.0, 105000.0, 0.0)
+        assert rho["high_pressure"] > rho["standard"]
 
-        assert rho_high_pressure > rho_standard
-
-    def test_low_pressure(self) -> None:
+    def test_low_pressure(self, rho: dict[str, float]) -> None:
         """Test that low pressure (altitude) decreases density."""
-        rho_standard = air_density_kg_m3(15.0, 101325.0, 0.0)
-        rho_altitude = air_density_kg_m3(15.0, 85000.0, 0.0)  # ~1500m altitude
-
-        assert rho_altitude < rho_standard
+        assert rho["low_pressure"] < rho["standard"]
 
-    def test_humidity_effect(self) -> None:
+    def test_humidity_effect(self, rho: dict[str, float]) -> None:
         """Test that humidity slightly decreases density."""
-        rho_dry = air_density_kg_m3(25.0, 101325.0, 0.0)
-        rho_humid = air_density_kg_m3(25.0, 101325.0, 0.8)  # 80% humidity
-
         # Humid air is slightly less dense (water vapor is lighter than dry air)
-        assert rho_humid < rho_dry
+        assert rho["humid_25c"] < rho["dry_25c"]
 
-    def test_realistic_range(self) -> None:
+    def test_realistic_range(self, rho: dict[str, float]) -> None:
         """Test density is in realistic range for various conditions."""
         # Sea level, hot summer day
-        rho_hot = air_density_kg_m3(35.0, 101325.0, 0.6)
-        assert 1.10 < rho_hot < 1.18
+        assert 1.10 < rho["hot_humid"] < 1.18
 
         # Sea level, cold winter day
-        rho_cold = air_density_kg_m3(-10.0, 102000.0, 0.2)
-        assert 1.30 < rho_cold < 1.38
+        assert 1.30 < rho["cold_winter"] < 1.38
 
         # High altitude (~2000m), moderate temperature
-        rho_altitude = air_density_kg_m3(15.0, 80000.0, 0.3)
-        assert 0.95 < rho_altitude < 1.05
+        assert 0.95 < rho["altitude"] < 1.05
+
+    def test_scalar_matches_vectorized(self) -> None:
+        """Test that the scalar and vectorized implementations agree."""
+        for temp_c, pressure_pa, humidity in _CONDITIONS.values():
+            scalar = air_density_kg_m3(temp_c, pressure_pa, humidity)
+            vec = air_density_kg_m3_vec(
+                np.array([temp_c]), np.array([pressure_pa]), np.array([humidity])
+            )
+            assert scalar == pytest.approx(float(vec[0]))
@@ -7,19 +7,48 @@ from optiride.fueling import (
     FuelingPoint,
     calculate_fatigue_index,
     calculate_fueling_points,
-    calculate_power_zones,
     calculate_w_prime_balance,
     get_power_zone_name,
 )
 
+# Independent module: its tests can share one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group(name="fueling")
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """Mark an array immutable so shared test inputs cannot be mutated."""
+    arr.flags.writeable = False
+    return arr
+
+
+# Synthetic ride profiles shared by the fueling tests below; built once at
+# import instead of per test (calculate_fueling_points never mutates inputs).
+# 3 hour / 100 km steady ride
+_LONG_DIST = _readonly(np.linspace(0, 100, 180))
+_LONG_TIME = _readonly(np.linspace(0, 3.0, 180))
+_LONG_POW = _readonly(np.full(180, 220.0))
+# 2.5 hour / 80 km ride at two steady intensities
+_MED_DIST = _readonly(np.linspace(0, 80, 120))
+_MED_TIME = _readonly(np.linspace(0, 2.5, 120))
+_MED_POW_220 = _readonly(np.full(120, 220.0))
+_MED_POW_240 = _readonly(np.full(120, 240.0))
+# 2 hour / 60 km ride above FTP (W'-depleting)
+_HARD_DIST = _readonly(np.linspace(0, 60, 120))
+_HARD_TIME = _readonly(np.linspace(0, 2.0, 120))
+_HARD_POW = _readonly(np.full(120, 280.0))
+# 2 hour / 60 km moderate ride
+_EASY_DIST = _readonly(np.linspace(0, 60, 90))
+_EASY_TIME = _readonly(np.linspace(0, 2.0, 90))
+_EASY_POW = _readonly(np.full(90, 220.0))
+
 
 class TestPowerZones:
     """Test power zone calculations."""
 
-    def test_power_zones_based_on_ftp(self) -> None:
+    def test_power_zones_based_on_ftp(self, power_zones_for) -> None:
         """Test that power zones are correctly calculated based on FTP."""
         ftp = 260.0
-        zones = calculate_power_zones(ftp)
+        zones = power_zones_for(ftp)
 
         assert zones["recovery"] == (0.0, 143.0)
         assert zones["endurance"] == (143.0, 195.0)
@@ -28,12 +57,12 @@ class TestPowerZones:
         assert zones["vo2max"] == (273.0, 312.0)
         assert zones["anaerobic"] == (312.0, float("inf"))
 
-    def test_power_zones_scale_with_ftp(self) -> None:
+    def test_power_zones_scale_with_ftp(self, power_zones_for) -> None:
         """Test that power zones scale proportionally with FTP."""
         ftp1 = 200.0
         ftp2 = 300.0
-        zones1 = calculate_power_zones(ftp1)
-        zones2 = calculate_power_zones(ftp2)
+        zones1 = power_zones_for(ftp1)
+        zones2 = power_zones_for(ftp2)
 
         # Check that zones scale by the same ratio as FTP
         ratio = ftp2 / ftp1
@@ -42,69 +71,76 @@ class TestPowerZones:
 
     def test_get_power_zone_name(self) -> None:
         """Test power zone name lookup."""
-        ftp = 260.0
-
-        assert get_power_zone_name(100, ftp) == "recovery"
-        assert get_power_zone_name(170, ftp) == "endurance"
-        assert get_power_zone_name(210, ftp) == "tempo"
-        assert get_power_zone_name(250, ftp) == "threshold"
-        assert get_power_zone_name(290, ftp) == "vo2max"
-        assert get_power_zone_name(350, ftp) == "anaerobic"
+        # One vectorized sweep over a probe power per zone
+        names = np.vectorize(get_power_zone_name)(np.array([100, 170, 210, 250, 290, 350]), 260.0)
+        assert names.tolist() == [
+            "recovery",
+            "endurance",
+            "tempo",
+            "threshold",
+            "vo2max",
+            "anaerobic",
+        ]
+
+
+# Power profiles for the W' balance scenarios (CP 250 W, W' 20 kJ)
+_WP_CP = 250.0
+_WP_CAPACITY = 20000.0
+_WP_PROFILES = {
+    "steady_below": (np.array([200.0, 200.0, 200.0]), np.array([0.0, 60.0, 120.0])),
+    "above_cp": (np.array([300.0, 300.0, 300.0, 300.0]), np.array([0.0, 60.0, 120.0, 180.0])),
+    "deplete_recover": (
+        np.array([300.0, 300.0, 200.0, 200.0]),
+        np.array([0.0, 60.0, 120.0, 240.0]),
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def w_bal() -> dict[str, np.ndarray]:
+    """W' balance computed once per scenario and shared across the tests."""
+    return {
+        name: calculate_w_prime_balance(powers, times, _WP_CP, _WP_CAPACITY)
+        for name, (powers, times) in _WP_PROFILES.items()
+    }
 
 
 class TestWPrimeBalance:
     """Test W' balance calculations."""
 
-    def test_starts_at_full_capacity(self) -> None:
+    def test_starts_at_full_capacity(self, w_bal: dict[str, np.ndarray]) -> None:
         """Test that W' balance starts at 100%."""
-        powers = np.array([200.0, 200.0, 200.0])
-        times = np.array([0.0, 60.0, 120.0])
-        cp = 250.0
-        w_prime = 20000.0
+        assert w_bal["steady_below"][0] == pytest.approx(1.0)
 
-        w_balance = calculate_w_prime_balance(powers, times, cp, w_prime)
-
-        assert w_balance[0] == pytest.approx(1.0)
-
-    def test_depletes_above_cp(self) -> None:
+    def test_depletes_above_cp(self, w_bal: dict[str, np.ndarray]) -> None:
         """Test that W' depletes when riding above CP."""
-        powers = np.array([300.0, 300.0, 300.0, 300.0])
-        times = np.array([0.0, 60.0, 120.0, 180.0])
-        cp = 250.0
-        w_prime = 20000.0
-
-        w_balance = calculate_w_prime_balance(powers, times, cp, w_prime)
+        balance = w_bal["above_cp"]
 
         # Should deplete over time when above CP
-        assert w_balance[1] < w_balance[0]
-        assert w_balance[2] < w_balance[1]
-        assert w_balance[3] < w_balance[2]
+        assert balance[1] < balance[0]
+        assert balance[2] < balance[1]
+        assert balance[3] < balance[2]
 
-    def test_recovers_below_cp(self) -> None:
+    def test_recovers_below_cp(self, w_bal: dict[str, np.ndarray]) -> None:
         """Test that W' recovers when riding below CP."""
-        # First deplete, then recover
-        powers = np.array([300.0, 300.0, 200.0, 200.0])
-        times = np.array([0.0, 60.0, 120.0, 240.0])
-        cp = 250.0
-        w_prime = 20000.0
-
-        w_balance = calculate_w_prime_balance(powers, times, cp, w_prime)
+        balance = w_bal["deplete_recover"]
 
         # Should recover after dropping below CP
-        assert w_balance[2] < w_balance[1]  # Still depleting at transition
-        assert w_balance[3] > w_balance[2]  # Recovering
+        assert balance[2] < balance[1]  # Still depleting at transition
+        assert balance[3] > balance[2]  # Recovering
 
     def test_clamped_to_valid_range(self) -> None:
         """Test that W' balance is clamped between 0 and 1."""
-        powers = np.array([500.0] * 100)  # Very high power
+        powers = np.full(100, 500.0)  # Very high power
         times = np.arange(0, 100 * 60, 60, dtype=float)
         cp = 250.0
         w_prime = 20000.0
 
         w_balance = calculate_w_prime_balance(powers, times, cp, w_prime)
 
-        assert np.all(w_balance >= 0.0)
-        assert np.all(w_balance <= 1.0)
+        # Single-pass reductions instead of allocating two boolean arrays
+        assert w_balance.min() >= 0.0
+        assert w_balance.max() <= 1.0
 
     def test_no_cp_returns_full_capacity(self) -> None:
         """Test that when CP/W' not available, returns 100%."""
@@ -113,53 +149,79 @@ class TestWPrimeBalance:
 
         w_balance = calculate_w_prime_balance(powers, times, None, None)  # type: ignore
 
-        assert np.all(w_balance == 1.0)
+        # min == max == 1.0 checks every element without a temporary bool array
+        assert w_balance.min() == 1.0
+        assert w_balance.max() == 1.0
+
+
+# Named (w_prime_balance_pct, time_h, intensity_factor) cases evaluated in a
+# single vectorized sweep by the fixture below
+_FATIGUE_CASES = {
+    "fresh": (1.0, 0.5, 0.7),
+    "depleted": (0.2, 1.0, 0.75),
+    "topped_up": (0.8, 1.0, 0.75),
+    "short": (0.7, 1.0, 0.75),
+    "long": (0.7, 5.0, 0.75),
+    "easy": (0.7, 2.0, 0.65),
+    "hard": (0.7, 2.0, 0.95),
+    "exhausted": (0.0, 10.0, 1.1),
+}
+
+_fatigue_vec = np.vectorize(calculate_fatigue_index)
+
+
+@pytest.fixture(scope="module")
+def fatigue() -> dict[str, float]:
+    """Fatigue indices for all named cases, computed in one vectorized call."""
+    w_pct, time_h, intensity = (np.array(col) for col in zip(*_FATIGUE_CASES.values()))
+    values = _fatigue_vec(w_pct, time_h, intensity)
+    return dict(zip(_FATIGUE_CASES, values.tolist()))
 
 
 class TestFatigueIndex:
     """Test fatigue index calculations."""
 
-    def test_fresh_rider_low_fatigue(self) -> None:
+    def test_fresh_rider_low_fatigue(self, fatigue: dict[str, float]) -> None:
         """Test that fresh rider with full W' has low fatigue."""
-        fatigue = calculate_fatigue_index(w_prime_balance_pct=1.0, time_h=0.5, intensity_factor=0.7)
-        assert fatigue < 30.0
+        assert fatigue["fresh"] < 30.0
 
-    def test_depleted_w_prime_increases_fatigue(self) -> None:
+    def test_depleted_w_prime_increases_fatigue(self, fatigue: dict[str, float]) -> None:
         """Test that depleted W' increases fatigue."""
-        fatigue_high = calculate_fatigue_index(
-            w_prime_balance_pct=0.2, time_h=1.0, intensity_factor=0.75
-        )
-        fatigue_low = calculate_fatigue_index(
-            w_prime_balance_pct=0.8, time_h=1.0, intensity_factor=0.75
-        )
-        assert fatigue_high > fatigue_low
+        assert fatigue["depleted"] > fatigue["topped_up"]
 
-    def test_long_duration_increases_fatigue(self) -> None:
+    def test_long_duration_increases_fatigue(self, fatigue: dict[str, float]) -> None:
         """Test that longer duration increases fatigue."""
-        fatigue_short = calculate_fatigue_index(
-            w_prime_balance_pct=0.7, time_h=1.0, intensity_factor=0.75
-        )
-        fatigue_long = calculate_fatigue_index(
-            w_prime_balance_pct=0.7, time_h=5.0, intensity_factor=0.75
-        )
-        assert fatigue_long > fatigue_short
+        assert fatigue["long"] > fatigue["short"]
 
-    def test_high_intensity_increases_fatigue(self) -> None:
+    def test_high_intensity_increases_fatigue(self, fatigue: dict[str, float]) -> None:
         """Test that higher intensity increases fatigue."""
-        fatigue_easy = calculate_fatigue_index(
-            w_prime_balance_pct=0.7, time_h=2.0, intensity_factor=0.65
-        )
-        fatigue_hard = calculate_fatigue_index(
-            w_prime_balance_pct=0.7, time_h=2.0, intensity_factor=0.95
-        )
-        assert fatigue_hard > fatigue_easy
+        assert fatigue["hard"] > fatigue["easy"]
 
-    def test_fatigue_clamped_to_100(self) -> None:
+    def test_fatigue_clamped_to_100(self, fatigue: dict[str, float]) -> None:
         """Test that fatigue is clamped to maximum 100."""
-        fatigue = calculate_fatigue_index(
-            w_prime_balance_pct=0.0, time_h=10.0, intensity_factor=1.1
+        assert fatigue["exhausted"] <= 100.0
+
+
+@pytest.fixture(scope="module")
+def points_med_240() -> list[FuelingPoint]:
+    """Fueling points for the 2.5 h / 240 W profile, computed once and shared."""
+    return calculate_fueling_points(_MED_DIST, _MED_TIME, _MED_POW_240, ftp=260.0)
+
+
+@pytest.fixture(scope="module")
+def points_by_interval() -> dict[float, list[FuelingPoint]]:
+    """Fueling points for the 2.5 h / 220 W profile, per refuel interval."""
+    return {
+        interval: calculate_fueling_points(
+            _MED_DIST,
+            _MED_TIME,
+            _MED_POW_220,
+            ftp=260.0,
+            refuel_interval_min=interval,
+            carbs_per_hour=60.0,
         )
-        assert fatigue <= 100.0
+        for interval in (20.0, 30.0)
+    }
 
 
 class TestCalculateFuelingPoints:
@@ -178,29 +240,18 @@ class TestCalculateFuelingPoints:
     def test_long_ride_generates_refueling_points(self) -> None:
         """Test that long rides generate appropriate refueling points."""
         # 3 hour ride
-        n_points = 180
-        distances = np.linspace(0, 100, n_points)
-        times = np.linspace(0, 3.0, n_points)
-        powers = np.full(n_points, 220.0)
-
         points = calculate_fueling_points(
-            distances, times, powers, ftp=260.0, refuel_interval_min=20.0
+            _LONG_DIST, _LONG_TIME, _LONG_POW, ftp=260.0, refuel_interval_min=20.0
         )
 
         # Should have ~9 refueling points (3h * 60min/h / 20min)
         assert len(points) >= 8
         assert len(points) <= 10
 
-    def test_fueling_point_has_all_attributes(self) -> None:
+    def test_fueling_point_has_all_attributes(self, points_med_240: list[FuelingPoint]) -> None:
         """Test that fueling points have all required attributes."""
-        distances = np.linspace(0, 80, 120)
-        times = np.linspace(0, 2.5, 120)
-        powers = np.full(120, 240.0)
-
-        points = calculate_fueling_points(distances, times, powers, ftp=260.0)
-
-        assert len(points) > 0
-        point = points[0]
+        assert len(points_med_240) > 0
+        point = points_med_240[0]
 
         assert isinstance(point, FuelingPoint)
         assert point.distance_km > 0
@@ -215,16 +266,11 @@ class TestCalculateFuelingPoints:
 
     def test_high_fatigue_recommends_gels(self) -> None:
         """Test that high fatigue leads to gel recommendations."""
-        # Create scenario with depleting W' (high intensity)
-        n_points = 120
-        distances = np.linspace(0, 60, n_points)
-        times = np.linspace(0, 2.0, n_points)
-        powers = np.full(n_points, 280.0)  # High intensity (>FTP)
-
+        # Depleting W' scenario: steady power above FTP
         points = calculate_fueling_points(
-            distances,
-            times,
-            powers,
+            _HARD_DIST,
+            _HARD_TIME,
+            _HARD_POW,
             ftp=260.0,
             cp=260.0,
             w_prime=20000.0,
@@ -233,21 +279,15 @@ class TestCalculateFuelingPoints:
 
         # Later refueling points should favor gels due to fatigue
         if len(points) > 2:
-            assert any(p.refuel_type == "gel" for p in points[-2:])
+            recent_types = {p.refuel_type for p in points[-2:]}
+            assert "gel" in recent_types
 
-    def test_carbs_scale_with_interval(self) -> None:
+    def test_carbs_scale_with_interval(
+        self, points_by_interval: dict[float, list[FuelingPoint]]
+    ) -> None:
         """Test that carb amounts scale with refueling interval."""
-        distances = np.linspace(0, 80, 120)
-        times = np.linspace(0, 2.5, 120)
-        powers = np.full(120, 220.0)
-
-        points_20min = calculate_fueling_points(
-            distances, times, powers, ftp=260.0, refuel_interval_min=20.0, carbs_per_hour=60.0
-        )
-
-        points_30min = calculate_fueling_points(
-            distances, times, powers, ftp=260.0, refuel_interval_min=30.0, carbs_per_hour=60.0
-        )
+        points_20min = points_by_interval[20.0]
+        points_30min = points_by_interval[30.0]
 
         # 30min interval should have ~1.5x more carbs per point
         if points_20min and points_30min:
@@ -256,25 +296,17 @@ class TestCalculateFuelingPoints:
 
     def test_without_cp_w_prime_still_works(self) -> None:
         """Test that fueling calculation works without CP/W' data."""
-        distances = np.linspace(0, 60, 90)
-        times = np.linspace(0, 2.0, 90)
-        powers = np.full(90, 220.0)
-
         points = calculate_fueling_points(
-            distances, times, powers, ftp=260.0, cp=None, w_prime=None
+            _EASY_DIST, _EASY_TIME, _EASY_POW, ftp=260.0, cp=None, w_prime=None
         )
 
         assert len(points) > 0
         # W' balance should be 100% throughout
         assert all(p.w_prime_balance_pct == 1.0 for p in points)
 
-    def test_energy_deficit_increases_over_time(self) -> None:
+    def test_energy_deficit_increases_over_time(self, points_med_240: list[FuelingPoint]) -> None:
         """Test that energy deficit accumulates over the ride."""
-        distances = np.linspace(0, 80, 120)
-        times = np.linspace(0, 2.5, 120)
-        powers = np.full(120, 240.0)
-
-        points = calculate_fueling_points(distances, times, powers, ftp=260.0)
+        points = points_med_240
 
         # Energy deficit should increase at each refueling point
         for i in range(1, len(points)):
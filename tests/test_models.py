@@ -1,51 +1,57 @@
 """Tests for data models."""
 
+import pytest
+
 from optiride.models import Environment, RiderBike
 
+# Independent module: its tests can share one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group(name="models")
+
+
+@pytest.fixture
+def base_rider() -> RiderBike:
+    """Minimal RiderBike built from the required parameters only."""
+    return RiderBike(
+        mass_rider_kg=72.0,
+        mass_bike_kg=8.0,
+        crr=0.0035,
+        cda=0.30,
+    )
+
+
+@pytest.fixture
+def power_rider() -> RiderBike:
+    """RiderBike variant carrying FTP and W' data."""
+    return RiderBike(
+        mass_rider_kg=72.0,
+        mass_bike_kg=8.0,
+        crr=0.0035,
+        cda=0.30,
+        ftp=260.0,
+        w_prime_j=20000.0,
+    )
+
 
 class TestRiderBike:
     """Test RiderBike model."""
 
-    def test_initialization(self) -> None:
+    def test_initialization(self, base_rider: RiderBike) -> None:
         """Test RiderBike initialization with required parameters."""
-        rider = RiderBike(
-            mass_rider_kg=72.0,
-            mass_bike_kg=8.0,
-            crr=0.0035,
-            cda=0.30,
-        )
-
-        assert rider.mass_rider_kg == 72.0
-        assert rider.mass_bike_kg == 8.0
-        assert rider.crr == 0.0035
-        assert rider.cda == 0.30
-        assert rider.drivetrain_eff == 0.97  # Default value
+        assert base_rider.mass_rider_kg == 72.0
+        assert base_rider.mass_bike_kg == 8.0
+        assert base_rider.crr == 0.0035
+        assert base_rider.cda == 0.30
+        assert base_rider.drivetrain_eff == 0.97  # Default value
 
-    def test_total_mass(self) -> None:
+    def test_total_mass(self, base_rider: RiderBike) -> None:
         """Test mass_system_kg property."""
-        rider = RiderBike(
-            mass_rider_kg=72.0,
-            mass_bike_kg=8.0,
-            crr=0.0035,
-            cda=0.30,
-        )
+        assert base_rider.mass_system_kg == 80.0
 
-        assert rider.mass_system_kg == 80.0
-
-    def test_with_power_parameters(self) -> None:
+    def test_with_power_parameters(self, power_rider: RiderBike) -> None:
         """Test RiderBike with FTP and W' parameters."""
-        rider = RiderBike(
-            mass_rider_kg=72.0,
-            mass_bike_kg=8.0,
-            crr=0.0035,
-            cda=0.30,
-            ftp=260.0,
-            w_prime_j=20000.0,
-        )
-
-        assert rider.ftp == 260.0
-        assert rider.w_prime_j == 20000.0
-        assert rider.cp is None  # Not set
+        assert power_rider.ftp == 260.0
+        assert power_rider.w_prime_j == 20000.0
+        assert power_rider.cp is None  # Not set
 
 
 class TestEnvironment:
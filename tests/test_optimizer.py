@@ -0,0 +1,72 @@
+"""Tests for pacing heuristic and route simulation."""
+
+import numpy as np
+
+from optiride.models import Environment, RiderBike
+from optiride.optimizer import pace_heuristic, simulate, simulate_batch
+
+
+class TestSimulateBatch:
+    """Test batched multi-scenario simulation."""
+
+    def test_matches_scalar_simulate(self, standard_rider: RiderBike) -> None:
+        """Test that each scenario row matches an individual simulate call."""
+        dist = np.arange(0.0, 2000.0, 20.0)
+        slope = 0.03 * np.sin(dist / 300.0)
+        bearings = (dist / 10.0) % 360.0
+        P_target = np.full_like(dist, 220.0)
+
+        rho_arr = np.array([1.225, 1.15])
+        wind_u_arr = np.array([0.0, 3.0])
+        wind_v_arr = np.array([0.0, -2.0])
+
+        v_all, dt_all, T_arr, work_arr = simulate_batch(
+            dist, slope, bearings, P_target, standard_rider, rho_arr, wind_u_arr, wind_v_arr
+        )
+
+        for i in range(len(rho_arr)):
+            env = Environment(
+                air_density=float(rho_arr[i]),
+                wind_u_ms=float(wind_u_arr[i]),
+                wind_v_ms=float(wind_v_arr[i]),
+            )
+            v, dt, T, work = simulate(dist, slope, bearings, P_target, standard_rider, env)
+            assert np.allclose(v_all[i], v, atol=1e-6)
+            assert np.allclose(dt_all[i], dt, atol=1e-6)
+            assert abs(T_arr[i] - T) < 1e-3
+            assert abs(work_arr[i] - work) < 1.0
+
+    def test_headwind_scenario_slower(self, standard_rider: RiderBike) -> None:
+        """Test that a headwind scenario yields a longer total time."""
+        dist = np.arange(0.0, 1000.0, 20.0)
+        slope = np.zeros_like(dist)
+        bearings = np.zeros_like(dist)  # Riding north
+        P_target = np.full_like(dist, 200.0)
+
+        # Scenario 1: calm; scenario 2: 5 m/s wind from the north (headwind)
+        _, _, T_arr, _ = simulate_batch(
+            dist,
+            slope,
+            bearings,
+            P_target,
+            standard_rider,
+            np.array([1.225, 1.225]),
+            np.array([0.0, 0.0]),
+            np.array([0.0, -5.0]),
+        )
+        assert T_arr[1] > T_arr[0]
+
+
+class TestPaceHeuristic:
+    """Test power-target heuristic."""
+
+    def test_uphill_gets_more_power(self, standard_environment: Environment) -> None:
+        """Test that steep uphill sections get boosted power targets."""
+        rb = RiderBike(mass_rider_kg=72.0, mass_bike_kg=8.0, crr=0.0035, cda=0.30)
+        dist = np.arange(0.0, 1000.0, 20.0)
+        slope = np.zeros_like(dist)
+        slope[25:] = 0.05
+        bearings = np.zeros_like(dist)
+
+        P = pace_heuristic(dist, slope, bearings, rb, standard_environment, P_flat=200.0)
+        assert P[-1] > P[0]
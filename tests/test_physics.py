@@ -1,11 +1,19 @@
 """Tests for physics calculations."""
 
+import functools
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
 from optiride.models import Environment, RiderBike
 from optiride.physics import (
     GRAVITY,
     power_required,
+    power_required_vec,
     relative_air_speed,
     speed_from_power,
+    speed_from_power_newton,
 )
 
 
@@ -41,97 +49,207 @@ class TestRelativeAirSpeed:
 class TestPowerRequired:
     """Test power requirement calculations."""
 
-    def test_flat_terrain_no_wind(
+    @pytest.mark.parametrize(
+        ("v_ms", "slope", "low", "high"),
+        [
+            pytest.param(10.0, 0.0, 100.0, 300.0, id="flat"),
+            pytest.param(15.0, -0.10, 0.0, float("inf"), id="steep-descent"),
+        ],
+    )
+    def test_power_within_expected_range(
+        self,
+        v_ms: float,
+        slope: float,
+        low: float,
+        high: float,
+        standard_rider: RiderBike,
+        standard_environment: Environment,
+    ) -> None:
+        """Test that power stays within physically expected bounds."""
+        power = power_required(v_ms, slope, 0.0, standard_rider, standard_environment)
+        assert low <= power < high
+
+    def test_monotonic_in_grade_and_speed(
         self, standard_rider: RiderBike, standard_environment: Environment
     ) -> None:
-        """Test power on flat terrain with no wind."""
-        power = power_required(10.0, 0.0, 0.0, standard_rider, standard_environment)
+        """Test power ordering across grades and speeds in one vectorized pass."""
+        # Descent < flat < climb at constant speed
+        powers_by_grade = power_required_vec(
+            10.0, np.array([-0.05, 0.0, 0.05]), 0.0, standard_rider, standard_environment
+        )
+        assert np.all(np.diff(powers_by_grade) > 0)
+
+        # More speed, more power (primarily aero drag) on the flat
+        powers_by_speed = power_required_vec(
+            np.array([8.0, 10.0, 12.0]), 0.0, 0.0, standard_rider, standard_environment
+        )
+        assert np.all(np.diff(powers_by_speed) > 0)
+
+    def test_vectorized_matches_scalar(
+        self, standard_rider: RiderBike, windy_environment: Environment
+    ) -> None:
+        """Test that power_required_vec agrees with the scalar implementation."""
+        speeds = np.array([5.0, 10.0, 15.0])
+        slopes = np.array([-0.08, 0.0, 0.06])
+        bearings = np.array([0.0, 135.0, 270.0])
 
-        # Should be positive and in reasonable range
-        assert power > 0
-        assert 100 < power < 300
+        batch = power_required_vec(speeds, slopes, bearings, standard_rider, windy_environment)
+        for i in range(len(speeds)):
+            scalar = power_required(
+                float(speeds[i]), float(slopes[i]), float(bearings[i]),
+                standard_rider, windy_environment,
+            )
+            assert abs(batch[i] - scalar) < 1e-9
 
-    def test_climbing(self, standard_rider: RiderBike, standard_environment: Environment) -> None:
-        """Test that climbing requires more power than flat."""
-        power_flat = power_required(10.0, 0.0, 0.0, standard_rider, standard_environment)
-        power_climb = power_required(
-            10.0, 0.05, 0.0, standard_rider, standard_environment
-        )  # 5% grade
 
-        assert power_climb > power_flat
+@pytest.fixture(scope="module")
+def solve(
+    standard_rider: RiderBike, standard_environment: Environment
+) -> Callable[[float, float], float]:
+    """Memoized speed_from_power bound to the shared rider/environment.
 
-    def test_descending(self, standard_rider: RiderBike, standard_environment: Environment) -> None:
-        """Test power on descent."""
-        power_flat = power_required(10.0, 0.0, 0.0, standard_rider, standard_environment)
-        power_down = power_required(
-            10.0, -0.05, 0.0, standard_rider, standard_environment
-        )  # -5% grade
+    Several tests below solve the identical (200 W, flat) case; caching by
+    (power, slope) runs each distinct solve once per module.
+    """
 
-        # Descending requires less power
-        assert power_down < power_flat
+    @functools.lru_cache(maxsize=None)
+    def _solve(power_w: float, slope_tan: float) -> float:
+        return speed_from_power(power_w, slope_tan, 0.0, standard_rider, standard_environment)
 
-    def test_faster_speed_more_power(
-        self, standard_rider: RiderBike, standard_environment: Environment
-    ) -> None:
-        """Test that higher speed requires more power (primarily due to aero drag)."""
-        power_slow = power_required(8.0, 0.0, 0.0, standard_rider, standard_environment)
-        power_fast = power_required(12.0, 0.0, 0.0, standard_rider, standard_environment)
-
-        assert power_fast > power_slow
-
-    def test_non_negative_power(
-        self, standard_rider: RiderBike, standard_environment: Environment
-    ) -> None:
-        """Test that power is always non-negative."""
-        # Even on steep descent
-        power = power_required(15.0, -0.10, 0.0, standard_rider, standard_environment)  # -10% grade
-
-        assert power >= 0.0
+    return _solve
 
 
 class TestSpeedFromPower:
     """Test speed calculation from power."""
 
+    @pytest.mark.parametrize(
+        ("power_w", "low", "high"),
+        [
+            pytest.param(100.0, 6.0, 9.0, id="easy"),
+            pytest.param(200.0, 8.0, 12.0, id="tempo"),
+            pytest.param(300.0, 10.0, 13.0, id="hard"),
+        ],
+    )
     def test_reasonable_speed_range(
-        self, standard_rider: RiderBike, standard_environment: Environment
+        self,
+        power_w: float,
+        low: float,
+        high: float,
+        solve: Callable[[float, float], float],
     ) -> None:
-        """Test that calculated speed is in reasonable range."""
-        speed = speed_from_power(200.0, 0.0, 0.0, standard_rider, standard_environment)
+        """Test that calculated flat-ground speeds are in reasonable ranges."""
+        assert low < solve(power_w, 0.0) < high
+
+    @pytest.mark.parametrize(
+        ("slope", "low", "high"),
+        [
+            pytest.param(-0.05, 13.0, 15.0, id="moderate-descent"),
+            pytest.param(-0.10, 16.0, 60.0 / 3.6, id="capped-descent"),
+        ],
+    )
+    def test_zero_power_coasting_descent(
+        self,
+        slope: float,
+        low: float,
+        high: float,
+        solve: Callable[[float, float], float],
+    ) -> None:
+        """Test coasting speed at 0 W on descents.
 
-        # 200W on flat should give ~30-40 km/h (8-11 m/s)
-        assert 8.0 < speed < 12.0
+        Regression test: the bracket tightening must not collapse onto the
+        power_required zero-clamp plateau below the true coasting speed.
+        """
+        assert low < solve(0.0, slope) <= high
 
-    def test_more_power_more_speed(
-        self, standard_rider: RiderBike, standard_environment: Environment
-    ) -> None:
+    def test_more_power_more_speed(self, solve: Callable[[float, float], float]) -> None:
         """Test that more power yields higher speed."""
-        speed_low = speed_from_power(150.0, 0.0, 0.0, standard_rider, standard_environment)
-        speed_high = speed_from_power(250.0, 0.0, 0.0, standard_rider, standard_environment)
+        assert solve(250.0, 0.0) > solve(150.0, 0.0)
 
-        assert speed_high > speed_low
-
-    def test_climbing_slower(
-        self, standard_rider: RiderBike, standard_environment: Environment
-    ) -> None:
+    def test_climbing_slower(self, solve: Callable[[float, float], float]) -> None:
         """Test that same power yields lower speed when climbing."""
-        speed_flat = speed_from_power(200.0, 0.0, 0.0, standard_rider, standard_environment)
-        speed_climb = speed_from_power(
-            200.0, 0.05, 0.0, standard_rider, standard_environment
-        )  # 5% grade
-
-        assert speed_climb < speed_flat
+        assert solve(200.0, 0.05) < solve(200.0, 0.0)  # 5% grade
 
     def test_inverse_of_power_required(
-        self, standard_rider: RiderBike, standard_environment: Environment
+        self,
+        solve: Callable[[float, float], float],
+        standard_rider: RiderBike,
+        standard_environment: Environment,
     ) -> None:
         """Test that speed_from_power is inverse of power_required."""
         target_speed = 10.0
         power = power_required(target_speed, 0.02, 0.0, standard_rider, standard_environment)
-        calculated_speed = speed_from_power(power, 0.02, 0.0, standard_rider, standard_environment)
+        calculated_speed = solve(power, 0.02)
 
         # Should recover original speed (within numerical tolerance)
         assert abs(calculated_speed - target_speed) < 0.01
 
+    @pytest.mark.slow
+    def test_speed_from_power_perf(
+        self,
+        request: pytest.FixtureRequest,
+        standard_rider: RiderBike,
+        standard_environment: Environment,
+    ) -> None:
+        """Pin solver performance so future changes do not regress it.
+
+        Skipped unless pytest-benchmark is installed; run with
+        ``pytest -m slow`` to collect timings.
+        """
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        speed = benchmark(
+            speed_from_power, 200.0, 0.0, 0.0, standard_rider, standard_environment
+        )
+        assert 8.0 < speed < 12.0
+
+
+class TestSpeedFromPowerNewton:
+    """Test the Newton variant against the bisection reference."""
+
+    @pytest.mark.parametrize(
+        ("power_w", "slope", "bearing", "windy"),
+        [
+            pytest.param(200.0, 0.0, 0.0, False, id="flat"),
+            pytest.param(250.0, 0.05, 0.0, False, id="climb"),
+            pytest.param(200.0, 0.0, 135.0, True, id="crosswind"),
+            pytest.param(150.0, -0.02, 270.0, True, id="shallow-descent-tailwind"),
+        ],
+    )
+    def test_matches_bisection(
+        self,
+        power_w: float,
+        slope: float,
+        bearing: float,
+        windy: bool,
+        standard_rider: RiderBike,
+        standard_environment: Environment,
+        windy_environment: Environment,
+    ) -> None:
+        """Test that Newton agrees with a tight-tolerance bisection solve."""
+        env = windy_environment if windy else standard_environment
+        reference = speed_from_power(power_w, slope, bearing, standard_rider, env, xtol=1e-6)
+        newton = speed_from_power_newton(power_w, slope, bearing, standard_rider, env)
+
+        assert abs(newton - reference) < 0.01
+
+    def test_zero_power_descent_uses_fallback(
+        self, standard_rider: RiderBike, standard_environment: Environment
+    ) -> None:
+        """Test the bisection fallback on a coasting descent.
+
+        At 0 W on a steep descent the Newton iterate leaves the physical
+        bracket (speed capped at 60 km/h), so the solver must fall back to
+        bisection and still return the coasting speed.
+        """
+        reference = speed_from_power(
+            0.0, -0.10, 0.0, standard_rider, standard_environment, xtol=1e-6
+        )
+        newton = speed_from_power_newton(0.0, -0.10, 0.0, standard_rider, standard_environment)
+
+        assert abs(newton - reference) < 0.01
+        assert newton > 16.0  # near the 60 km/h cap, not a collapsed bracket
+
 
 class TestConstants:
     """Test physical constants."""